@@ -0,0 +1,64 @@
+"""
+TooBit API SDK - JSON Codec Benchmark
+Compare decode time of an all-symbols 24hr ticker payload per codec
+"""
+
+import random
+import time
+import timeit
+
+import requests
+
+from open_api_sdk.codec import CODECS, get_codec
+
+def build_ticker_payload(symbols: int = 800) -> bytes:
+    """Build a realistic /quote/v1/ticker/24hr response for all symbols"""
+    rng = random.Random(42)
+    now = int(time.time() * 1000)
+    tickers = []
+    for i in range(symbols):
+        last = rng.uniform(0.0001, 60000)
+        open_price = last * rng.uniform(0.9, 1.1)
+        tickers.append({
+            "t": now,
+            "s": f"SYM{i}USDT" if i % 2 else f"SYM{i}-SWAP-USDT",
+            "c": f"{last:.8f}",
+            "h": f"{last * 1.05:.8f}",
+            "l": f"{last * 0.95:.8f}",
+            "o": f"{open_price:.8f}",
+            "b": f"{last * 0.9999:.8f}",
+            "a": f"{last * 1.0001:.8f}",
+            "v": f"{rng.uniform(0, 1e7):.4f}",
+            "qv": f"{rng.uniform(0, 1e9):.4f}",
+            "pc": f"{last - open_price:.8f}",
+            "pcp": f"{(last - open_price) / open_price:.4f}",
+        })
+    return get_codec("json").dumps(tickers)
+
+def requests_json(content: bytes):
+    """Previous decode path: requests.Response.json()"""
+    response = requests.Response()
+    response._content = content
+    response.status_code = 200
+    return response.json()
+
+def run_benchmark(number: int = 50):
+    """Run JSON Codec Benchmark"""
+    payload = build_ticker_payload()
+    print(f"Payload: {len(payload) / 1024:.0f} KB, {number} decodes per codec")
+    
+    candidates = {"requests Response.json()": requests_json}
+    for name in CODECS:
+        try:
+            candidates[f"codec {name}"] = get_codec(name).loads
+        except ImportError:
+            print(f"codec {name}: not installed, skipped")
+    
+    baseline = None
+    for label, decode in candidates.items():
+        seconds = min(timeit.repeat(lambda: decode(payload), number=number, repeat=3)) / number
+        baseline = baseline or seconds
+        print(f"{label:<26} {seconds * 1000:8.3f} ms/decode  x{baseline / seconds:.2f}")
+
+if __name__ == "__main__":
+    run_benchmark()
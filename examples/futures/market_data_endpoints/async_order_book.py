@@ -0,0 +1,30 @@
+"""
+TooBit Futures API SDK - Async Order Book
+Fetch several order books concurrently with AsyncTooBitClient
+"""
+
+import asyncio
+from open_api_sdk import AsyncTooBitClient, TooBitConfig
+
+async def get_order_books():
+    """Get Order Books Concurrently"""
+    try:
+        config = TooBitConfig.from_env()
+        async with AsyncTooBitClient(config) as client:
+            symbols = ["BTCUSDT", "ETHUSDT"]
+            print(f"Request Parameters: symbols={symbols}, limit=10")
+            
+            responses = await asyncio.gather(
+                *[client.get_order_book(symbol, 10) for symbol in symbols]
+            )
+            
+            for symbol, response in zip(symbols, responses):
+                print(f"{symbol} Response: {response}")
+            return responses
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        return None
+
+if __name__ == "__main__":
+    asyncio.run(get_order_books())
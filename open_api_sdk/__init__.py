@@ -3,11 +3,21 @@ TooBit API SDK - A complete cryptocurrency trading API client library
 """
 
 from .client import TooBitClient
+from .async_client import AsyncTooBitClient
 from .config import TooBitConfig
+from .ratelimit import RateLimiter
+from .symbols import SymbolRegistry
+from .validation import OrderValidator
+from .batching import OrderBatcher, AsyncOrderBatcher, CancelBatcher, AsyncCancelBatcher
+from .backfill import HistoryBackfill, AsyncHistoryBackfill
+from .sync import HistorySync, JsonCheckpointStore
+from .klines import KlineStore, KlineResampler
+from .klinecache import KlineCache
+from .orderbook import OrderBookEngine
 from .exceptions import TooBitException, APIError, ConfigurationError, AuthenticationError, OrderError, RateLimitError, ValidationError, NetworkError
 from .models import (
     OrderRequest, CreateOrderResponse, OrderResponse, CancelOrderRequest, CancelOrderResponse,
-    OrderQueryRequest, Trade, ExchangeInfo, Ticker24hr,
+    OrderQueryRequest, Trade, ExchangeInfo, SymbolFilters, Ticker24hr,
     OrderBook, Kline, OrderSide, OrderType, TimeInForce, OrderStatus,
     CreateFuturesOrderResponse, CancelFuturesOrderResponse, QueryFuturesOrderResponse,
     FuturesOpenOrderResponse, CancelAllOrdersResponse, BatchCancelOrderResult, BatchCancelOrdersResponse,
@@ -23,7 +33,9 @@ from .models import (
 __version__ = "1.0.0"
 __all__ = [
     "TooBitClient",
+    "AsyncTooBitClient",
     "TooBitConfig", 
+    "RateLimiter",
     "TooBitException",
     "APIError",
     "ConfigurationError",
@@ -39,6 +51,21 @@ __all__ = [
     "OrderQueryRequest",
     "Trade",
     "ExchangeInfo",
+    "SymbolFilters",
+    "SymbolRegistry",
+    "OrderValidator",
+    "OrderBatcher",
+    "AsyncOrderBatcher",
+    "CancelBatcher",
+    "AsyncCancelBatcher",
+    "HistoryBackfill",
+    "AsyncHistoryBackfill",
+    "HistorySync",
+    "JsonCheckpointStore",
+    "KlineStore",
+    "KlineResampler",
+    "KlineCache",
+    "OrderBookEngine",
     "Ticker24hr",
     "OrderBook",
     "Kline",
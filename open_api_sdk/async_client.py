@@ -0,0 +1,292 @@
+"""
+TooBit API asyncio client
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
+
+try:
+    import aiohttp
+    import yarl
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+from .batching import chunk_orders, merge_chunk_responses
+from .client import TooBitClient
+from .clock import ServerClock
+from .config import TooBitConfig
+from .exceptions import TooBitException, NetworkError
+from .klines import MAX_KLINES_LIMIT, KlineStore, kline_pages, stitch_klines
+from .pagination import PageCursor, apaginate
+from .ratelimit import RateLimiter
+from .singleflight import AsyncSingleFlight, request_key
+from .symbols import SymbolRegistry
+from .transport import MARKET_LANE, TRADE_LANE, lane_pool_maxsize, lane_timeout, request_lane
+
+
+class AsyncTooBitClient(TooBitClient):
+    """TooBit API asyncio Client
+
+    Exposes the same methods as ``TooBitClient``; every API method returns an
+    awaitable instead of a result. Signing and error mapping are shared with
+    the synchronous client, only the transport differs.
+    """
+
+    def __init__(self, config: TooBitConfig, rate_limiter: Optional[RateLimiter] = None):
+        """Initialize client"""
+        if aiohttp is None:
+            raise ImportError("AsyncTooBitClient requires aiohttp: pip install toobit-api-sdk[async]")
+        self._time_sync_task: Optional[asyncio.Task] = None
+        self._trade_keepalive_task: Optional[asyncio.Task] = None
+        super().__init__(config, rate_limiter)
+
+    @property
+    def symbol_registry(self) -> SymbolRegistry:
+        """Cached exchangeInfo indexed by symbol
+
+        Lookups never block the event loop: call ``await refresh_symbol_registry()``
+        to load it and again whenever fresh data is needed.
+        """
+        if self._symbol_registry is None:
+            self._symbol_registry = SymbolRegistry(ttl=self.config.exchange_info_ttl)
+        return self._symbol_registry
+
+    async def refresh_symbol_registry(self) -> SymbolRegistry:
+        """Fetch exchangeInfo and rebuild the symbol registry"""
+        registry = self.symbol_registry
+        registry.load(await self.get_exchange_info())
+        return registry
+
+    def _create_single_flight(self) -> AsyncSingleFlight:
+        """Create the coalescer shared by identical concurrent GET requests"""
+        return AsyncSingleFlight()
+
+    def _create_session(self, lane: str = MARKET_LANE) -> None:
+        """The aiohttp sessions are created lazily inside the running event loop"""
+        return None
+
+    def _start_trade_keepalive(self):
+        """Started from __aenter__ once the event loop is running"""
+
+    def _lane_session(self, lane: str) -> "aiohttp.ClientSession":
+        """Return the aiohttp session of a connection lane, creating it on first use"""
+        session = self.trade_session if lane == TRADE_LANE else self.session
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                # aiohttp has no overflow connections, without pool_block the pool is unbounded
+                limit=lane_pool_maxsize(self.config, lane) if self.config.pool_block else 0,
+                keepalive_timeout=self.config.pool_keepalive_timeout
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"User-Agent": "TooBit-SDK/1.0.0"},
+                timeout=aiohttp.ClientTimeout(total=lane_timeout(self.config, lane))
+            )
+            if lane == TRADE_LANE:
+                self.trade_session = session
+            else:
+                self.session = session
+        return session
+
+    async def warmup(self, connections: Optional[int] = None) -> int:
+        """Open pooled connections on both lanes with concurrent pings
+
+        The market lane opens ``connections`` (default ``pool_maxsize``), the trade
+        lane ``trade_pool_maxsize`` connections. Returns the number of successful pings.
+        """
+        lanes = [MARKET_LANE] * (connections or self.config.pool_maxsize)
+        lanes += [TRADE_LANE] * self.config.trade_pool_maxsize
+        results = await asyncio.gather(*[self._try_ping(lane) for lane in lanes])
+        return sum(results)
+
+    async def _try_ping(self, lane: str = MARKET_LANE) -> bool:
+        """Ping once over a lane without retries, reporting success"""
+        try:
+            await self._send_request('GET', '/quote/v1/ping', lane=lane)
+            return True
+        except TooBitException:
+            return False
+
+    async def _trade_keepalive_loop(self):
+        """Ping over the trade lane every ``trade_keepalive_interval`` seconds"""
+        while True:
+            await asyncio.sleep(self.config.trade_keepalive_interval)
+            await self._try_ping(TRADE_LANE)
+
+    def _start_time_sync(self):
+        """Start background server clock sampling, requires a running event loop"""
+        if self._time_sync_task is not None and not self._time_sync_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Started from __aenter__ once the loop is running
+            return
+        self._time_sync_task = loop.create_task(self._time_sync_loop())
+
+    async def _time_sync_loop(self):
+        """Sample the server clock every ``time_sync_interval`` seconds"""
+        while True:
+            try:
+                await self.clock.sample_async(self._fetch_server_time, self._reserve_server_time)
+            except TooBitException:
+                # Keep the last estimate, the next tick will try again
+                pass
+            await asyncio.sleep(self.config.time_sync_interval)
+
+    async def sync_time(self) -> ServerClock:
+        """Take one server clock sample now and return the clock"""
+        if self.clock is None:
+            self.clock = ServerClock()
+        await self.clock.sample_async(self._fetch_server_time, self._reserve_server_time)
+        return self.clock
+
+    async def _reserve_server_time(self) -> None:
+        """Wait for the rate limiter before a clock sample starts timing"""
+        if self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve('GET', '/quote/v1/time')
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def _submit_batch(self, endpoint: str, orders_data: list) -> Dict[str, Any]:
+        """POST an order list to a batchOrders endpoint, chunked to ``batch_order_limit`` and sent concurrently"""
+        chunks = chunk_orders(orders_data, self.config.batch_order_limit)
+        if len(chunks) <= 1:
+            return await self._make_request('POST', endpoint, {}, data=orders_data, signed=True)
+        outcomes = await asyncio.gather(
+            *[self._make_request('POST', endpoint, {}, data=chunk, signed=True) for chunk in chunks],
+            return_exceptions=True
+        )
+        # Only API errors become per-order entries, anything else is a bug worth raising
+        for outcome in outcomes:
+            if isinstance(outcome, Exception) and not isinstance(outcome, TooBitException):
+                raise outcome
+        return merge_chunk_responses(chunks, outcomes)
+
+    async def fetch_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        limit: int = MAX_KLINES_LIMIT
+    ) -> KlineStore:
+        """Get all klines opening in [start_time, end_time] as one columnar ``KlineStore``, pages fetched concurrently"""
+        pages = kline_pages(interval, start_time, end_time, limit)
+        results = await asyncio.gather(*[self.get_klines(symbol, interval, limit, *page) for page in pages])
+        return stitch_klines(symbol, interval, results, start_time, end_time)
+
+    def _iter_history(self, endpoint: str, cursor: PageCursor) -> AsyncIterator[Dict[str, Any]]:
+        """Stream the records of a history endpoint page by page, use with ``async for``"""
+        return apaginate(lambda params: self._make_request('GET', endpoint, params, signed=True), cursor)
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying transient failures according to ``retry_policy``
+
+        With ``coalesce_requests`` enabled, identical concurrent unsigned GETs share one request and its result.
+        """
+        if self.single_flight is not None and not signed and method.upper() == 'GET':
+            return await self.single_flight.do(
+                request_key(endpoint, params),
+                lambda: self._request_with_retry(method, endpoint, params, data, signed, **kwargs)
+            )
+        return await self._request_with_retry(method, endpoint, params, data, signed, **kwargs)
+
+    async def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying transient failures according to ``retry_policy``"""
+        attempt = 0
+        while True:
+            try:
+                return await self._send_request(method, endpoint, params, data, signed, **dict(kwargs))
+            except TooBitException as e:
+                if not self.retry_policy.should_retry(attempt, method, e, params, data):
+                    raise
+                await asyncio.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a single HTTP request attempt"""
+        if kwargs.pop('rate_limited', True) and self.rate_limiter is not None:
+            wait = self.rate_limiter.reserve(method, endpoint, params, data)
+            if wait > 0:
+                await asyncio.sleep(wait)
+        lane = kwargs.pop('lane', None) or request_lane(method, endpoint)
+
+        try:
+            url, headers, body = self._prepare_request(
+                method, endpoint, params, data, signed, kwargs.pop('headers', None)
+            )
+
+            # The query string is already encoded (and signed), send it verbatim
+            async with self._lane_session(lane).request(
+                method.upper(),
+                yarl.URL(url, encoded=True),
+                data=body,
+                headers=headers,
+                **kwargs
+            ) as response:
+                content = await response.read()
+                return self._parse_response(response.status, content)
+
+        except TooBitException as e:
+            self._request_failed(method, endpoint, e)
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error_msg = f"Network request error: {str(e) or type(e).__name__}"
+            raise self._request_failed(method, endpoint, NetworkError(error_msg)) from e
+        except ValueError as e:
+            error_msg = f"ParametersError: {str(e)}"
+            raise self._request_failed(method, endpoint, TooBitException(error_msg)) from e
+        except Exception as e:
+            error_msg = f"Unknown error: {str(e)}"
+            raise self._request_failed(method, endpoint, TooBitException(error_msg)) from e
+
+    async def close(self):
+        """Close client"""
+        for task in (self._time_sync_task, self._trade_keepalive_task):
+            if task is not None:
+                task.cancel()
+        self._time_sync_task = self._trade_keepalive_task = None
+        for session in (self.session, self.trade_session):
+            if session is not None and not session.closed:
+                await session.close()
+
+    def __enter__(self):
+        raise TypeError("AsyncTooBitClient must be used with 'async with'")
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    async def __aenter__(self):
+        if self.clock is not None:
+            self._start_time_sync()
+        if self.config.trade_keepalive_interval > 0 and self._trade_keepalive_task is None:
+            self._trade_keepalive_task = asyncio.get_running_loop().create_task(self._trade_keepalive_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
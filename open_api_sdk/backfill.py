@@ -0,0 +1,235 @@
+"""
+TooBit API parallel time-sharded history backfill
+"""
+
+import asyncio
+import heapq
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import TooBitException
+from .models import QueryFuturesHistoryOrdersRequest, QueryFuturesTradeHistoryRequest, QueryFuturesAccountFlowRequest
+from .pagination import PageCursor, apaginate, paginate
+
+
+Window = Tuple[int, int]
+
+
+def split_window(start_time: int, end_time: int, parts: int) -> List[Window]:
+    """Split the inclusive millisecond range [start_time, end_time] into up to ``parts`` disjoint windows"""
+    parts = max(1, min(parts, end_time - start_time + 1))
+    step = (end_time - start_time + 1) / parts
+    bounds = [start_time + round(step * index) for index in range(parts + 1)]
+    return [(bounds[index], bounds[index + 1] - 1) for index in range(parts)]
+
+
+def remaining_windows(window: Window, page: List[Dict[str, Any]], time_key: str, page_size: int) -> List[Window]:
+    """Windows still to fetch after ``page`` came back for ``window``
+
+    A short page completes its window. A full page covers one end of the
+    window (whichever end the endpoint sorts first), so the rest is split in
+    two and fetched concurrently; the boundary millisecond is fetched again
+    and de-duplicated when merging.
+    """
+    if len(page) < page_size:
+        return []
+    start_time, end_time = window
+    times = [int(record[time_key]) for record in page]
+    rest = (start_time, min(times)) if times[0] >= times[-1] else (max(times), end_time)
+    if rest == window:
+        # No progress: every record of the page sits on the far boundary
+        if start_time == end_time:
+            return [window]
+        return split_window(start_time, end_time, 2)
+    return split_window(rest[0], rest[1], 2)
+
+
+def _sort_key(record: Dict[str, Any], id_key: str, time_key: str) -> Tuple[int, int]:
+    return int(record[time_key]), int(record[id_key])
+
+
+def merge_shards(shards: List[List[Dict[str, Any]]], id_key: str = 'id', time_key: str = 'time') -> Iterator[Dict[str, Any]]:
+    """Merge per-shard records into one stream sorted by time and ID, dropping duplicates"""
+    ordered = [sorted(shard, key=lambda record: _sort_key(record, id_key, time_key)) for shard in shards if shard]
+    previous = None
+    for record in heapq.merge(*ordered, key=lambda record: _sort_key(record, id_key, time_key)):
+        key = _sort_key(record, id_key, time_key)
+        if key != previous:
+            previous = key
+            yield record
+
+
+class HistoryBackfill:
+    """Fetch a long time range of history concurrently
+
+    [start_time, end_time] is split into ``windows`` shards fetched by up to
+    ``max_workers`` threads, each request going through the client's rate
+    limiter. A shard that returns a full page is split again around what it
+    returned, so busy periods are sharded finer while quiet ones cost a single
+    request. When a full page shares one millisecond, that millisecond is
+    paged by record ID through ``cursor_param`` (``fromId`` for trades and
+    account flow, ``orderId`` backwards for orders); without an ID cursor
+    the backfill raises instead of returning a truncated result. Results are merged into one stream sorted by time and
+    ID, with records on shard boundaries yielded once.
+    """
+
+    def __init__(self, client, max_workers: Optional[int] = None, windows: Optional[int] = None):
+        self.client = client
+        self.max_workers = max_workers or client.config.pool_maxsize
+        self.windows = windows or self.max_workers * 4
+
+    @staticmethod
+    def _millisecond_cursor(endpoint: str, page_params: Dict[str, Any], page: List[Dict[str, Any]], page_size: int,
+                            id_key: str, time_key: str, cursor_param: Optional[str],
+                            cursor_descending: bool) -> Tuple[PageCursor, List[Dict[str, Any]]]:
+        """ID cursor for the rest of a full page of records that all share one millisecond
+
+        Returns the cursor and the records of ``page`` to keep. A page sorted
+        the way the cursor walks is continued from its last ID; otherwise the
+        millisecond is paged again from the cursor's open end and the
+        records fetched twice are dropped when merging.
+        """
+        if cursor_param is None:
+            raise TooBitException(
+                f"More than {page_size} records at {time_key}={page_params['startTime']} and {endpoint} "
+                f"has no ID cursor to page them, the backfill would be incomplete",
+                endpoint=endpoint
+            )
+        ids = [int(record[id_key]) for record in page]
+        resume = (ids[0] > ids[-1]) == cursor_descending
+        if resume:
+            start_id = min(ids) if cursor_descending else max(ids)
+        else:
+            start_id = sys.maxsize if cursor_descending else 1
+        cursor = PageCursor(dict(page_params, **{cursor_param: start_id}), id_key, time_key, page_size,
+                            cursor_param, cursor_descending)
+        return cursor, cursor.advance(page) if resume else page
+
+    def _fetch_window(self, endpoint: str, params: Dict[str, Any], window: Window, page_size: int,
+                      id_key: str, time_key: str, cursor_param: Optional[str] = None,
+                      cursor_descending: bool = False) -> Tuple[List[Dict[str, Any]], List[Window]]:
+        start_time, end_time = window
+        page_params = dict(params, startTime=start_time, endTime=end_time, limit=page_size)
+        page = self.client._make_request('GET', endpoint, page_params, signed=True)
+        follow_up = remaining_windows(window, page, time_key, page_size)
+        if follow_up == [window]:
+            cursor, records = self._millisecond_cursor(endpoint, page_params, page, page_size, id_key, time_key,
+                                                       cursor_param, cursor_descending)
+            fetch = lambda cursor_params: self.client._make_request('GET', endpoint, cursor_params, signed=True)
+            return records + list(paginate(fetch, cursor)), []
+        return page, follow_up
+
+    def fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_time: int,
+        end_time: int,
+        id_key: str = 'id',
+        time_key: str = 'time',
+        page_size: int = 1000,
+        cursor_param: Optional[str] = None,
+        cursor_descending: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Backfill any time-windowed history endpoint, returning records sorted by time
+
+        ``cursor_param`` names the endpoint's ID cursor (``cursor_descending``
+        when it returns records older than the ID), used only for a
+        millisecond holding more than ``page_size`` records.
+        """
+        shards: List[List[Dict[str, Any]]] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {
+                executor.submit(self._fetch_window, endpoint, params, window, page_size, id_key, time_key,
+                                cursor_param, cursor_descending)
+                for window in split_window(start_time, end_time, self.windows)
+            }
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    records, follow_up = future.result()
+                    shards.append(records)
+                    pending |= {
+                        executor.submit(self._fetch_window, endpoint, params, window, page_size, id_key, time_key,
+                                        cursor_param, cursor_descending)
+                        for window in follow_up
+                    }
+        return merge_shards(shards, id_key, time_key)
+
+    def futures_history_orders(self, request: QueryFuturesHistoryOrdersRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All historical futures orders in [start_time, end_time]"""
+        params = request.model_dump(exclude_none=True, by_alias=True, exclude={'orderId', 'startTime', 'endTime', 'limit'})
+        return self.fetch('/api/v1/futures/historyOrders', params, start_time, end_time, 'orderId', 'time',
+                          cursor_param='orderId', cursor_descending=True)
+
+    def futures_trade_history(self, request: QueryFuturesTradeHistoryRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All futures trades in [start_time, end_time]"""
+        params = request.model_dump(exclude_none=True, by_alias=True, exclude={'fromId', 'toId', 'startTime', 'endTime', 'limit'})
+        return self.fetch('/api/v1/futures/userTrades', params, start_time, end_time, 'id', 'time', cursor_param='fromId')
+
+    def futures_account_flow(self, request: QueryFuturesAccountFlowRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All futures account flow records in [start_time, end_time]"""
+        params = request.model_dump(exclude_none=True, by_alias=True, exclude={'fromId', 'endId', 'startTime', 'endTime', 'limit'})
+        return self.fetch('/api/v1/futures/balanceFlow', params, start_time, end_time, 'id', 'created', cursor_param='fromId')
+
+
+class AsyncHistoryBackfill(HistoryBackfill):
+    """asyncio counterpart of ``HistoryBackfill`` for ``AsyncTooBitClient``
+
+    ``fetch`` and the endpoint helpers are coroutines returning the merged
+    iterator; ``max_workers`` bounds the requests in flight.
+    """
+
+    async def _fetch_window(self, endpoint: str, params: Dict[str, Any], window: Window, page_size: int,
+                            id_key: str, time_key: str, cursor_param: Optional[str] = None,
+                            cursor_descending: bool = False) -> Tuple[List[Dict[str, Any]], List[Window]]:
+        start_time, end_time = window
+        page_params = dict(params, startTime=start_time, endTime=end_time, limit=page_size)
+        page = await self.client._make_request('GET', endpoint, page_params, signed=True)
+        follow_up = remaining_windows(window, page, time_key, page_size)
+        if follow_up == [window]:
+            cursor, records = self._millisecond_cursor(endpoint, page_params, page, page_size, id_key, time_key,
+                                                       cursor_param, cursor_descending)
+            fetch = lambda cursor_params: self.client._make_request('GET', endpoint, cursor_params, signed=True)
+            return records + [record async for record in apaginate(fetch, cursor)], []
+        return page, follow_up
+
+    async def fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        start_time: int,
+        end_time: int,
+        id_key: str = 'id',
+        time_key: str = 'time',
+        page_size: int = 1000,
+        cursor_param: Optional[str] = None,
+        cursor_descending: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """Backfill any time-windowed history endpoint, returning records sorted by time"""
+        semaphore = asyncio.Semaphore(self.max_workers)
+        shards: List[List[Dict[str, Any]]] = []
+
+        async def run(window: Window):
+            async with semaphore:
+                records, follow_up = await self._fetch_window(endpoint, params, window, page_size, id_key, time_key,
+                                                              cursor_param, cursor_descending)
+            shards.append(records)
+            await asyncio.gather(*[run(next_window) for next_window in follow_up])
+
+        await asyncio.gather(*[run(window) for window in split_window(start_time, end_time, self.windows)])
+        return merge_shards(shards, id_key, time_key)
+
+    async def futures_history_orders(self, request: QueryFuturesHistoryOrdersRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All historical futures orders in [start_time, end_time]"""
+        return await super().futures_history_orders(request, start_time, end_time)
+
+    async def futures_trade_history(self, request: QueryFuturesTradeHistoryRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All futures trades in [start_time, end_time]"""
+        return await super().futures_trade_history(request, start_time, end_time)
+
+    async def futures_account_flow(self, request: QueryFuturesAccountFlowRequest, start_time: int, end_time: int) -> Iterator[Dict[str, Any]]:
+        """All futures account flow records in [start_time, end_time]"""
+        return await super().futures_account_flow(request, start_time, end_time)
+
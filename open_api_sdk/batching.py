@@ -0,0 +1,388 @@
+"""
+TooBit API micro-batching of order submissions and cancellations
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from .exceptions import ValidationError
+from .log import logger
+from .models import OrderRequest, FuturesOrderRequest
+
+
+AnyOrderRequest = Union[OrderRequest, FuturesOrderRequest]
+
+SPOT = "spot"
+FUTURES = "futures"
+
+
+def _client_order_id(order: AnyOrderRequest) -> Optional[str]:
+    if isinstance(order, FuturesOrderRequest):
+        return order.newClientOrderId
+    return order.new_client_order_id
+
+
+def _with_client_order_id(order: AnyOrderRequest) -> AnyOrderRequest:
+    """Give an order a client order ID so its batch result can be matched back"""
+    if _client_order_id(order):
+        return order
+    field = "newClientOrderId" if isinstance(order, FuturesOrderRequest) else "new_client_order_id"
+    return order.model_copy(update={field: uuid.uuid4().hex})
+
+
+def match_batch_results(orders: List[AnyOrderRequest], response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-order result entries of a batchOrders response, in the order of ``orders``
+
+    Entries are matched by ``clientOrderId``; failed entries carry no order
+    and take their position in the result list, or the next unmatched order.
+    """
+    entries = response.get('result') or [] if isinstance(response, dict) else response or []
+    index_by_id = {_client_order_id(order): index for index, order in enumerate(orders)}
+    matched: List[Optional[Dict[str, Any]]] = [None] * len(orders)
+    unmatched = []
+    for position, entry in enumerate(entries):
+        index = index_by_id.get((entry.get('order') or {}).get('clientOrderId'))
+        if index is not None and matched[index] is None:
+            matched[index] = entry
+        else:
+            unmatched.append((position, entry))
+    for position, entry in unmatched:
+        if position >= len(orders) or matched[position] is not None:
+            position = next((index for index, found in enumerate(matched) if found is None), None)
+            if position is None:
+                break
+        matched[position] = entry
+    missing = {'code': -1000, 'msg': 'No result returned for order'}
+    return [entry if entry is not None else dict(missing) for entry in matched]
+
+
+def match_cancel_results(order_ids: List[str], response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Per-order ``{"orderId", "code"}`` entries of a batch cancel response, in the order of ``order_ids``
+
+    The response only lists the orders that failed; every other order gets
+    the response code.
+    """
+    success_code = response.get('code', 200) if isinstance(response, dict) else 200
+    entries = response.get('result') or [] if isinstance(response, dict) else response or []
+    failed = {str(entry.get('orderId')): entry for entry in entries}
+    return [failed.get(order_id) or {'orderId': order_id, 'code': success_code} for order_id in order_ids]
+
+
+def chunk_orders(orders: List[Any], size: int) -> List[List[Any]]:
+    """Split an order list into consecutive chunks of at most ``size`` orders"""
+    return [orders[start:start + size] for start in range(0, len(orders), size)]
+
+
+def merge_chunk_responses(chunks: List[List[Any]], outcomes: List[Any]) -> Dict[str, Any]:
+    """Merge the responses of chunked batchOrders requests into one in the original order
+
+    ``outcomes`` holds each chunk's response or the TooBitException it raised;
+    the orders of a failed chunk get ``{"code", "msg"}`` entries with that
+    error. Re-raises the first error when every chunk failed.
+    """
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Exception)]
+    if len(errors) == len(outcomes):
+        raise errors[0]
+    code = next(outcome.get('code', 200) for outcome in outcomes if not isinstance(outcome, Exception))
+    result: List[Dict[str, Any]] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        if isinstance(outcome, Exception):
+            entry = {'code': getattr(outcome, 'code', None) or -1000, 'msg': getattr(outcome, 'message', str(outcome))}
+            result.extend(dict(entry) for _ in chunk)
+            continue
+        entries = list(outcome.get('result') or [])[:len(chunk)]
+        entries += [{'code': -1000, 'msg': 'No result returned for order'} for _ in range(len(chunk) - len(entries))]
+        result.extend(entries)
+    return {'code': code, 'result': result}
+
+
+def _resolve(waiters: List[Future], result: Any = None, error: Optional[BaseException] = None) -> None:
+    """Hand one result (or error) to every future waiting on an item"""
+    for future in waiters:
+        if future.done():
+            continue
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+
+class _ThreadedBatcher:
+    """Collects items per batch key and sends them from a background thread
+
+    Everything queued within ``window`` seconds of the first pending item
+    (or as soon as one key has ``max_batch_size`` items) is handed to
+    ``_send`` in batches of at most ``max_batch_size``. Every caller gets
+    its own future; items whose futures were all cancelled before their
+    batch left are not sent.
+    """
+
+    thread_name = "toobit-batcher"
+
+    def __init__(self, client, window: Optional[float] = None, max_batch_size: Optional[int] = None):
+        self.client = client
+        self.window = client.config.order_batch_window if window is None else window
+        self.max_batch_size = max_batch_size or client.config.batch_order_limit
+        self._pending: Dict[Hashable, List[Tuple[Any, List[Future]]]] = {}
+        self._queued: Dict[Tuple[Hashable, Hashable], List[Future]] = {}
+        self._first_pending_at: Optional[float] = None
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=self.thread_name, daemon=True)
+        self._thread.start()
+
+    def _enqueue(self, key: Hashable, item: Any, dedupe_id: Optional[Hashable] = None) -> Future:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError(f"{type(self).__name__} is closed")
+            future: Future = Future()
+            if dedupe_id is not None and (key, dedupe_id) in self._queued:
+                # Same item already queued: wait on its result without sending it twice
+                self._queued[(key, dedupe_id)].append(future)
+                return future
+            waiters = [future]
+            self._pending.setdefault(key, []).append((item, waiters))
+            if dedupe_id is not None:
+                self._queued[(key, dedupe_id)] = waiters
+            if self._first_pending_at is None:
+                self._first_pending_at = time.monotonic()
+            self._condition.notify()
+        return future
+
+    def _take_batches(self) -> List[Tuple[Hashable, List[Tuple[Any, List[Future]]]]]:
+        batches = []
+        for key, queue in self._pending.items():
+            for start in range(0, len(queue), self.max_batch_size):
+                batches.append((key, queue[start:start + self.max_batch_size]))
+        self._pending = {}
+        self._queued = {}
+        self._first_pending_at = None
+        return batches
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._first_pending_at is None and not self._closed:
+                    self._condition.wait()
+                if self._first_pending_at is None and self._closed:
+                    return
+                # Collect until the window closes or a batch is full
+                while not self._closed:
+                    remaining = self._first_pending_at + self.window - time.monotonic()
+                    if remaining <= 0 or any(len(queue) >= self.max_batch_size for queue in self._pending.values()):
+                        break
+                    self._condition.wait(remaining)
+                batches = self._take_batches()
+            for key, batch in batches:
+                # Claim the futures so they can no longer be cancelled, dropping items nobody waits for
+                claimed = [(item, [future for future in waiters if future.set_running_or_notify_cancel()])
+                           for item, waiters in batch]
+                batch = [(item, waiters) for item, waiters in claimed if waiters]
+                if not batch:
+                    continue
+                try:
+                    results = self._send(key, [item for item, _ in batch])
+                except Exception as e:
+                    for _, waiters in batch:
+                        _resolve(waiters, error=e)
+                    continue
+                try:
+                    for (_, waiters), result in zip(batch, results):
+                        _resolve(waiters, result)
+                except Exception as e:
+                    # Never let one batch stop the thread, later submissions would wait forever
+                    logger.exception("Failed to deliver batch results")
+                    for _, waiters in batch:
+                        _resolve(waiters, error=e)
+
+    def _send(self, key: Hashable, items: List[Any]) -> List[Any]:
+        raise NotImplementedError
+
+    def flush(self) -> None:
+        """Send pending items now instead of waiting for the window"""
+        with self._condition:
+            if self._first_pending_at is not None:
+                self._first_pending_at = float("-inf")
+                self._condition.notify()
+
+    def close(self) -> None:
+        """Send pending items and stop the background thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class _AsyncBatcher:
+    """asyncio counterpart of ``_ThreadedBatcher`` with one flush timer per batch key"""
+
+    def __init__(self, client, window: Optional[float] = None, max_batch_size: Optional[int] = None):
+        self.client = client
+        self.window = client.config.order_batch_window if window is None else window
+        self.max_batch_size = max_batch_size or client.config.batch_order_limit
+        self._pending: Dict[Hashable, List[Tuple[Any, asyncio.Future]]] = {}
+        self._queued: Dict[Tuple[Hashable, Hashable], asyncio.Future] = {}
+        self._timers: Dict[Hashable, asyncio.TimerHandle] = {}
+        self._tasks = set()
+
+    async def _enqueue(self, key: Hashable, item: Any, dedupe_id: Optional[Hashable] = None) -> Any:
+        if dedupe_id is not None and (key, dedupe_id) in self._queued:
+            return await asyncio.shield(self._queued[(key, dedupe_id)])
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        queue = self._pending.setdefault(key, [])
+        queue.append((item, future))
+        if dedupe_id is not None:
+            self._queued[(key, dedupe_id)] = future
+        if len(queue) >= self.max_batch_size:
+            self._flush_key(key)
+        elif key not in self._timers:
+            self._timers[key] = loop.call_later(self.window, self._flush_key, key)
+        # Shield so a cancelled caller does not cancel the result shared with the batch
+        return await asyncio.shield(future)
+
+    def _flush_key(self, key: Hashable) -> None:
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        queue = self._pending.pop(key, [])
+        self._queued = {queued: future for queued, future in self._queued.items() if queued[0] != key}
+        for start in range(0, len(queue), self.max_batch_size):
+            task = asyncio.ensure_future(self._run_batch(key, queue[start:start + self.max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, key: Hashable, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = await self._send(key, [item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _send(self, key: Hashable, items: List[Any]) -> List[Any]:
+        raise NotImplementedError
+
+    async def flush(self) -> None:
+        """Send pending items now and wait for the requests to finish"""
+        for key in list(self._pending):
+            self._flush_key(key)
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+
+class OrderBatcher(_ThreadedBatcher):
+    """Coalesce individual order submissions into batchOrders requests
+
+    ``submit`` queues an order and returns a ``concurrent.futures.Future``.
+    Orders queued within ``window`` seconds (up to ``max_batch_size`` per
+    request) are sent through ``batch_create_orders`` /
+    ``batch_create_futures_orders`` and each future resolves with that
+    order's result entry (``{"code": ..., "order": {...}}`` or
+    ``{"code": ..., "msg": ...}``). If the batch request itself fails,
+    every future in it gets the exception. With ``order_validation``
+    configured, each order is validated on ``submit`` so an invalid order
+    fails only its own future instead of the batch it would join.
+    """
+
+    thread_name = "toobit-order-batcher"
+
+    def submit(self, order: AnyOrderRequest, futures: Optional[bool] = None) -> Future:
+        """Queue an order; ``futures`` defaults to whether it is a FuturesOrderRequest"""
+        if futures is None:
+            futures = isinstance(order, FuturesOrderRequest)
+        try:
+            order = self.client._validate_order(order)
+        except ValidationError as e:
+            rejected: Future = Future()
+            rejected.set_exception(e)
+            return rejected
+        return self._enqueue(FUTURES if futures else SPOT, _with_client_order_id(order))
+
+    def _send(self, market: str, orders: List[AnyOrderRequest]) -> List[Dict[str, Any]]:
+        send = self.client.batch_create_futures_orders if market == FUTURES else self.client.batch_create_orders
+        return match_batch_results(orders, send(orders))
+
+
+class AsyncOrderBatcher(_AsyncBatcher):
+    """asyncio counterpart of ``OrderBatcher`` for ``AsyncTooBitClient``
+
+    ``submit`` is a coroutine returning the order's result entry.
+    """
+
+    async def submit(self, order: AnyOrderRequest, futures: Optional[bool] = None) -> Dict[str, Any]:
+        """Queue an order and wait for its result entry"""
+        if futures is None:
+            futures = isinstance(order, FuturesOrderRequest)
+        # Validate alone so an invalid order cannot reject the batch it would join
+        order = self.client._validate_order(order)
+        return await self._enqueue(FUTURES if futures else SPOT, _with_client_order_id(order))
+
+    async def _send(self, market: str, orders: List[AnyOrderRequest]) -> List[Dict[str, Any]]:
+        send = self.client.batch_create_futures_orders if market == FUTURES else self.client.batch_create_orders
+        return match_batch_results(orders, await send(orders))
+
+
+class CancelBatcher(_ThreadedBatcher):
+    """Coalesce individual order cancellations into batch cancel requests
+
+    ``cancel`` queues an order ID and returns a ``concurrent.futures.Future``.
+    Futures cancels are grouped by symbol and sent through
+    ``batch_cancel_orders(symbol, ids)``, spot cancels through
+    ``batch_cancel_spot_orders(ids)``. Repeated cancels of an order that is
+    still queued are sent once, each caller getting its own future. Each future resolves with
+    ``{"orderId": ..., "code": ...}``: the order's failure entry from the
+    response, or the response code when it was cancelled.
+    """
+
+    thread_name = "toobit-cancel-batcher"
+
+    def cancel(self, order_id: Union[str, int], symbol: Optional[str] = None, futures: bool = True) -> Future:
+        """Queue a cancel; futures cancels need the order's ``symbol``"""
+        if futures and not symbol:
+            raise ValueError("symbol is required to cancel futures orders")
+        order_id = str(order_id)
+        key = (FUTURES, symbol) if futures else (SPOT, None)
+        return self._enqueue(key, order_id, dedupe_id=order_id)
+
+    def _send(self, key: Tuple[str, Optional[str]], order_ids: List[str]) -> List[Dict[str, Any]]:
+        market, symbol = key
+        if market == FUTURES:
+            response = self.client.batch_cancel_orders(symbol, order_ids)
+        else:
+            response = self.client.batch_cancel_spot_orders(order_ids)
+        return match_cancel_results(order_ids, response)
+
+
+class AsyncCancelBatcher(_AsyncBatcher):
+    """asyncio counterpart of ``CancelBatcher`` for ``AsyncTooBitClient``"""
+
+    async def cancel(self, order_id: Union[str, int], symbol: Optional[str] = None, futures: bool = True) -> Dict[str, Any]:
+        """Queue a cancel and wait for its ``{"orderId", "code"}`` entry"""
+        if futures and not symbol:
+            raise ValueError("symbol is required to cancel futures orders")
+        order_id = str(order_id)
+        key = (FUTURES, symbol) if futures else (SPOT, None)
+        return await self._enqueue(key, order_id, dedupe_id=order_id)
+
+    async def _send(self, key: Tuple[str, Optional[str]], order_ids: List[str]) -> List[Dict[str, Any]]:
+        market, symbol = key
+        if market == FUTURES:
+            response = await self.client.batch_cancel_orders(symbol, order_ids)
+        else:
+            response = await self.client.batch_cancel_spot_orders(order_ids)
+        return match_cancel_results(order_ids, response)
@@ -4,14 +4,20 @@ TooBit API core client
 
 import hashlib
 import hmac
-import json
+import threading
 import time
 import urllib.parse
-from typing import Dict, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
 import requests
 
+from .batching import chunk_orders, merge_chunk_responses
+from .clock import ServerClock
+from .codec import get_codec
+from .klines import MAX_KLINES_LIMIT, KlineStore, kline_pages, stitch_klines
+from .log import logger, configure_logging
 from .config import TooBitConfig
-from .exceptions import TooBitException, raise_toobit_exception
+from .exceptions import TooBitException, NetworkError, RateLimitError, raise_toobit_exception
 from .models import (
     OrderRequest, CancelOrderRequest,
     OrderQueryRequest, OrderSide,
@@ -22,165 +28,367 @@ from .models import (
     AdjustLeverageRequest,
     QueryLeverageRequest
 )
+from .pagination import PageCursor, paginate
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight, request_key
+from .symbols import SymbolRegistry
+from .transport import MARKET_LANE, TRADE_LANE, create_session, lane_timeout, request_lane
+from .validation import OrderValidator
 
 
 class TooBitClient:
     """TooBit API Client"""
     
-    def __init__(self, config: TooBitConfig):
-        """Initialize client"""
+    def __init__(self, config: TooBitConfig, rate_limiter: Optional[RateLimiter] = None):
+        """Initialize client
+        
+        Pass the same ``rate_limiter`` to several clients to make them share one budget.
+        """
         self.config = config
         self.config.validate()
-        self.session = requests.Session()
-        self.session.headers.update({
-            "User-Agent": "TooBit-SDK/1.0.0"
-        })
-    
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
-        """Generate HMAC SHA256 signature"""
-        # Convert parameters to query string
-        query_string = urllib.parse.urlencode(params)
-        # Use API secret as key to generate signature
-        signature = hmac.new(
-            self.config.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-        return signature
-    
-    def _add_auth_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Add authentication parameters"""
+        configure_logging(config.log_level, config.log_sample_interval)
+        self.codec = get_codec(config.json_codec)
+        self._hmac = hmac.new(self.config.api_secret.encode('utf-8'), digestmod=hashlib.sha256)
+        self.retry_policy = RetryPolicy.from_config(config)
+        if rate_limiter is None and config.rate_limit_enabled:
+            rate_limiter = RateLimiter.from_config(config)
+        self.rate_limiter = rate_limiter
+        self.single_flight = self._create_single_flight() if config.coalesce_requests else None
+        self._symbol_registry: Optional[SymbolRegistry] = None
+        self._order_validator: Optional[OrderValidator] = None
+        # Market data and order traffic use separate connection lanes
+        self.session = self._create_session()
+        self.trade_session = self._create_session(TRADE_LANE)
+        self._trade_keepalive_stop = threading.Event()
+        if config.trade_keepalive_interval > 0:
+            self._start_trade_keepalive()
+        self.clock = ServerClock() if config.time_sync else None
+        if self.clock is not None:
+            self._start_time_sync()
+    
+    @property
+    def symbol_registry(self) -> SymbolRegistry:
+        """Cached exchangeInfo indexed by symbol, refreshed every ``exchange_info_ttl`` seconds"""
+        if self._symbol_registry is None:
+            self._symbol_registry = SymbolRegistry(self.get_exchange_info, self.config.exchange_info_ttl)
+        return self._symbol_registry
+    
+    @property
+    def order_validator(self) -> Optional[OrderValidator]:
+        """Local pre-trade validator, None unless ``order_validation`` is configured"""
+        if self._order_validator is None and self.config.order_validation:
+            self._order_validator = OrderValidator(self.symbol_registry, self.config.order_validation)
+        return self._order_validator
+    
+    def _validate_order(self, order_request):
+        """Round or reject an order against the symbol filters when validation is enabled"""
+        validator = self.order_validator
+        return order_request if validator is None else validator.validate(order_request)
+    
+    def _validate_orders(self, order_requests: list) -> list:
+        """Validate a whole order list in one pass when validation is enabled"""
+        validator = self.order_validator
+        return order_requests if validator is None else validator.validate_batch(order_requests)
+    
+    def _submit_batch(self, endpoint: str, orders_data: list) -> Dict[str, Any]:
+        """POST an order list to a batchOrders endpoint, chunked to ``batch_order_limit``
+        
+        Chunks are sent concurrently over the trade lane, each within the rate
+        limits, and merged into one ``{"code", "result"}`` in the original order;
+        orders of a failed chunk get that chunk's error as their result entry.
+        """
+        # Request body is directly the order array, serialized once by the client codec when sent
+        chunks = chunk_orders(orders_data, self.config.batch_order_limit)
+        if len(chunks) <= 1:
+            return self._make_request('POST', endpoint, {}, data=orders_data, signed=True)
+        
+        def send(chunk: list):
+            try:
+                return self._make_request('POST', endpoint, {}, data=chunk, signed=True)
+            except TooBitException as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=min(len(chunks), self.config.trade_pool_maxsize)) as executor:
+            outcomes = list(executor.map(send, chunks))
+        return merge_chunk_responses(chunks, outcomes)
+    
+    def _iter_history(self, endpoint: str, cursor: PageCursor) -> Iterator[Dict[str, Any]]:
+        """Stream the records of a history endpoint page by page"""
+        return paginate(lambda params: self._make_request('GET', endpoint, params, signed=True), cursor)
+    
+    def _create_single_flight(self) -> SingleFlight:
+        """Create the coalescer shared by identical concurrent GET requests"""
+        return SingleFlight()
+    
+    def _create_session(self, lane: str = MARKET_LANE) -> requests.Session:
+        """Create the HTTP session of a connection lane"""
+        return create_session(self.config, lane)
+    
+    def _lane_session(self, lane: str) -> requests.Session:
+        """HTTP session serving a connection lane"""
+        return self.trade_session if lane == TRADE_LANE else self.session
+    
+    def warmup(self, connections: Optional[int] = None) -> int:
+        """Open pooled connections on both lanes with concurrent pings
+        
+        The market lane opens ``connections`` (default ``pool_maxsize``), the trade
+        lane ``trade_pool_maxsize`` connections. Call before trading starts so the
+        first orders do not pay the TCP/TLS handshake. Returns the number of successful pings.
+        """
+        lanes = [MARKET_LANE] * (connections or self.config.pool_maxsize)
+        lanes += [TRADE_LANE] * self.config.trade_pool_maxsize
+        # Concurrent requests force each pool to hold distinct connections
+        with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+            results = list(executor.map(self._try_ping, lanes))
+        return sum(results)
+    
+    def _try_ping(self, lane: str = MARKET_LANE) -> bool:
+        """Ping once over a lane without retries, reporting success"""
+        try:
+            self._send_request('GET', '/quote/v1/ping', lane=lane)
+            return True
+        except TooBitException:
+            return False
+    
+    def _start_trade_keepalive(self):
+        """Ping over the trade lane every ``trade_keepalive_interval`` seconds in a daemon thread"""
+        def run():
+            while not self._trade_keepalive_stop.wait(self.config.trade_keepalive_interval):
+                self._try_ping(TRADE_LANE)
+        
+        threading.Thread(target=run, name="toobit-trade-keepalive", daemon=True).start()
+    
+    def _reserve_server_time(self) -> None:
+        """Wait for the rate limiter before a clock sample starts timing"""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire('GET', '/quote/v1/time')
+    
+    def _fetch_server_time(self) -> Dict[str, Any]:
+        """Single, non-retried server time request used for clock sampling
+        
+        Capacity is reserved beforehand by ``_reserve_server_time`` so the
+        measured round trip is the HTTP exchange only.
+        """
+        return self._send_request('GET', '/quote/v1/time', rate_limited=False)
+    
+    def _start_time_sync(self):
+        """Start background server clock sampling"""
+        self.clock.start(self._fetch_server_time, self.config.time_sync_interval, self._reserve_server_time)
+    
+    def sync_time(self) -> ServerClock:
+        """Take one server clock sample now and return the clock"""
+        if self.clock is None:
+            self.clock = ServerClock()
+        self.clock.sample(self._fetch_server_time, self._reserve_server_time)
+        return self.clock
+    
+    def _timestamp(self) -> int:
+        """Request timestamp in milliseconds, corrected by the server clock offset when synced"""
+        if self.clock is not None and self.clock.synced:
+            return self.clock.now_ms()
+        return int(time.time() * 1000)
+    
+    def _generate_signature(self, query_string: str) -> str:
+        """Generate HMAC SHA256 signature of an encoded query string"""
+        # Copy the pre-keyed HMAC instead of re-deriving the key pads on every call
+        mac = self._hmac.copy()
+        mac.update(query_string.encode('utf-8'))
+        return mac.hexdigest()
+    
+    def _add_auth_params(self, params: Dict[str, Any]) -> str:
+        """Add authentication parameters and return the signed query string"""
         # Add timestamp
-        params['timestamp'] = int(time.time() * 1000)
+        params['timestamp'] = self._timestamp()
         # Add receive window
         if 'recvWindow' not in params:
             params['recvWindow'] = self.config.recv_window
-        # Generate signature
-        params['signature'] = self._generate_signature(params)
-        return params
+        # Encode once, sign those exact bytes and send them unchanged
+        query_string = urllib.parse.urlencode(params)
+        return f"{query_string}&signature={self._generate_signature(query_string)}"
     
-    def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
+    def _prepare_request(
+        self,
+        method: str,
+        endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[str] = None,
+        data: Optional[Any] = None,
         signed: bool = False,
-        **kwargs
-    ) -> Dict[str, Any]:
-        """Send HTTP request"""
-        url = f"{self.config.base_url}{endpoint}"
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[str, Dict[str, str], Optional[bytes]]:
+        """Build URL (with its final query string), headers and encoded body shared by sync and async transports"""
+        if method.upper() not in ('GET', 'POST', 'DELETE'):
+            raise ValueError(f"Unsupported HTTP method: {method}")
         
-        if params is None:
-            params = {}
+        url = f"{self.config.base_url}{endpoint}"
+        # Copy so that a retried request is re-signed from the caller's parameters
+        params = {} if params is None else dict(params)
+        headers = {} if headers is None else headers
         
         # If it's a signed request, add authentication parameters
         if signed:
-            params = self._add_auth_params(params)
+            query_string = self._add_auth_params(params)
             # Add API key to request header
-            headers = kwargs.get('headers', {})
             headers['X-BB-APIKEY'] = self.config.api_key
-            kwargs['headers'] = headers
+        else:
+            query_string = urllib.parse.urlencode(params)
+        if query_string:
+            url = f"{url}?{query_string}"
         
-        try:
-            if method.upper() == 'GET':
-                response = self.session.get(
-                    url, 
-                    params=params, 
-                    timeout=self.config.timeout,
-                    **kwargs
-                )
-            elif method.upper() == 'POST':
-                # TooBit API POST request supports parameters in URL or request body
-                if data:
-                    # If there's a request body, use JSON format
-                    headers = kwargs.get('headers', {})
-                    headers['Content-Type'] = 'application/json'
-                    kwargs['headers'] = headers
-                    
-                    # If data is a string, parse as JSON object
-                    if isinstance(data, str):
-                        json_data = json.loads(data)
-                    else:
-                        json_data = data
-                    
-                    response = self.session.post(
-                        url, 
-                        params=params,
-                        json=json_data,  # Use json parameters
-                        timeout=self.config.timeout,
-                        **kwargs
-                    )
-                else:
-                    # TooBit API POST request usually puts parameters in URL, not in request body
-                    response = self.session.post(
-                        url,
-                        params=params,  # Change to params, parameters in URL
-                        timeout=self.config.timeout,
-                        **kwargs
-                    )
-            elif method.upper() == 'DELETE':
-                response = self.session.delete(
-                    url, 
-                    params=params, 
-                    timeout=self.config.timeout,
-                    **kwargs
-                )
+        # TooBit API POST request supports parameters in URL or request body
+        body = None
+        if method.upper() == 'POST' and data:
+            # If there's a request body, use JSON format
+            headers['Content-Type'] = 'application/json'
+            # Objects are serialized exactly once, pre-encoded bodies are sent as they are
+            if isinstance(data, bytes):
+                body = data
+            elif isinstance(data, str):
+                body = data.encode('utf-8')
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            # Check HTTP status code
-            if response.status_code >= 400:
-                error_msg = f"HTTPError: StatusCode {response.status_code}"
-                try:
-                    error_detail = response.json()
-                    print(f"Request Failed: {error_msg}")
-                    print(f"Error Response Details: {error_detail}")
-                    error_msg += f" | ErrorDetails: {error_detail}"
-                except:
-                    print(f"Request Failed: {error_msg}")
-                    print(f"Response content: {response.text}")
-                    error_msg += f" | Response content: {response.text}"
-                raise TooBitException(error_msg)
-            
-            response.raise_for_status()
-            
-            # Parse response
+                body = self.codec.dumps(data)
+        
+        return url, headers, body
+    
+    def _parse_response(self, status_code: int, content: bytes) -> Any:
+        """Decode an HTTP response body with the client codec and map API errors onto TooBit exceptions"""
+        # Check HTTP status code
+        if status_code >= 400:
+            error_msg = f"HTTPError: StatusCode {status_code}"
+            try:
+                error_detail = self.codec.loads(content)
+                error_msg += f" | ErrorDetails: {error_detail}"
+            except ValueError:
+                error_detail = None
+                error_msg += f" | Response content: {content.decode('utf-8', errors='replace')}"
+            # Prefer the API error code so callers (and the retry policy) get a typed exception
+            if isinstance(error_detail, dict) and isinstance(error_detail.get('code'), int):
+                raise_toobit_exception(error_detail['code'], error_detail.get('msg', ''), error_detail, status_code)
+            if status_code == 429:
+                raise RateLimitError(error_msg, status_code=status_code)
+            if status_code >= 500:
+                raise NetworkError(error_msg, status_code=status_code)
+            raise TooBitException(error_msg, status_code=status_code)
+        
+        # Parse response
+        try:
+            data = self.codec.loads(content)
+        except ValueError:
+            text = content.decode('utf-8', errors='replace')
+            error_msg = f"Response parsing failed: Unable to parse JSON response, Status code: {status_code}, Response content: {text}"
+            raise TooBitException(error_msg, status_code=status_code)
+        
+        # Check API error
+        if isinstance(data, dict) and 'code' in data and data['code'] != 200 and data['code'] != 0:
+            raise_toobit_exception(data['code'], data.get('msg', ''), data, status_code)
+        
+        return data
+    
+    def _request_failed(self, method: str, endpoint: str, error: TooBitException) -> TooBitException:
+        """Attach the request to the error and log it, repeated errors are sampled"""
+        if error.endpoint is None:
+            error.endpoint = f"{method.upper()} {endpoint}"
+        logger.warning(
+            "Request failed: %s | %s",
+            error.endpoint, error.message,
+            extra={"sample_key": (error.endpoint, type(error), error.code)}
+        )
+        if error.response:
+            logger.debug("Error response data: %s", error.response)
+        return error
+    
+    def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying transient failures according to ``retry_policy``
+        
+        With ``coalesce_requests`` enabled, identical concurrent unsigned GETs share one request and its result.
+        """
+        if self.single_flight is not None and not signed and method.upper() == 'GET':
+            return self.single_flight.do(
+                request_key(endpoint, params),
+                lambda: self._request_with_retry(method, endpoint, params, data, signed, **kwargs)
+            )
+        return self._request_with_retry(method, endpoint, params, data, signed, **kwargs)
+    
+    def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send HTTP request, retrying transient failures according to ``retry_policy``"""
+        attempt = 0
+        while True:
             try:
-                data = response.json()
-            except ValueError as e:
-                error_msg = f"Response parsing failed: Unable to parse JSON response, Status code: {response.status_code}, Response content: {response.text}"
-                print(f"Request Failed: {error_msg}")
-                raise TooBitException(error_msg)
+                return self._send_request(method, endpoint, params, data, signed, **dict(kwargs))
+            except TooBitException as e:
+                if not self.retry_policy.should_retry(attempt, method, e, params, data):
+                    raise
+                time.sleep(self.retry_policy.backoff(attempt))
+                attempt += 1
+    
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None,
+        signed: bool = False,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Send a single HTTP request attempt"""
+        if kwargs.pop('rate_limited', True) and self.rate_limiter is not None:
+            self.rate_limiter.acquire(method, endpoint, params, data)
+        lane = kwargs.pop('lane', None) or request_lane(method, endpoint)
+        
+        try:
+            url, headers, body = self._prepare_request(
+                method, endpoint, params, data, signed, kwargs.pop('headers', None)
+            )
             
-            # Check API error
-            if 'code' in data and data['code'] != 200 and data['code'] != 0:
-                error_msg = f"APIError: ErrorCode {data['code']}, ErrorInformation: {data.get('msg', '')}"
-                print(f"Request Failed: {error_msg}")
-                print(f"Complete error response: {data}")
-                raise_toobit_exception(data['code'], data.get('msg', ''), data)
+            response = self._lane_session(lane).request(
+                method.upper(),
+                url,
+                data=body,
+                headers=headers,
+                timeout=lane_timeout(self.config, lane),
+                **kwargs
+            )
             
-            return data
+            return self._parse_response(response.status_code, response.content)
             
+        except TooBitException as e:
+            self._request_failed(method, endpoint, e)
+            raise
         except requests.exceptions.RequestException as e:
             error_msg = f"Network request error: {str(e)}"
+            error_detail, status_code = None, None
             if hasattr(e, 'response') and e.response is not None:
+                status_code = e.response.status_code
                 try:
-                    error_detail = e.response.json()
-                    print(f"Request Failed Details: {error_detail}")
+                    error_detail = self.codec.loads(e.response.content)
                     error_msg += f" | ResponseDetails: {error_detail}"
-                except:
+                except ValueError:
                     error_msg += f" | HTTP status code: {e.response.status_code} | Response content: {e.response.text}"
-            print(f"Request Failed: {error_msg}")
-            raise TooBitException(error_msg)
+            raise self._request_failed(method, endpoint, NetworkError(
+                error_msg, response=error_detail if isinstance(error_detail, dict) else None, status_code=status_code
+            )) from e
         except ValueError as e:
             error_msg = f"ParametersError: {str(e)}"
-            print(f"Request Failed: {error_msg}")
-            raise TooBitException(error_msg)
+            raise self._request_failed(method, endpoint, TooBitException(error_msg)) from e
         except Exception as e:
             error_msg = f"Unknown error: {str(e)}"
-            print(f"Request Failed: {error_msg}")
-            raise TooBitException(error_msg)
+            raise self._request_failed(method, endpoint, TooBitException(error_msg)) from e
     
     # ==================== Market Data API ====================
     
@@ -212,15 +420,46 @@ class TooBitClient:
         }
         return self._make_request('GET', '/quote/v1/trades', params)
     
-    def get_klines(self, symbol: str, interval: str, limit: int = 500) -> list:
+    def get_klines(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 500,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None
+    ) -> list:
         """Get KLine Data"""
         params = {
             'symbol': symbol,
             'interval': interval,
             'limit': limit
         }
+        if start_time is not None:
+            params['startTime'] = start_time
+        if end_time is not None:
+            params['endTime'] = end_time
         return self._make_request('GET', '/quote/v1/klines', params)
     
+    def fetch_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start_time: int,
+        end_time: int,
+        limit: int = MAX_KLINES_LIMIT
+    ) -> KlineStore:
+        """Get all klines opening in [start_time, end_time] as one columnar ``KlineStore``
+        
+        The range is split into pages of ``limit`` candles fetched concurrently
+        within the rate limits; intervals the exchange returned no candle for are
+        listed in the store's ``gaps``. Raises ValueError if ``start_time`` is
+        after ``end_time``.
+        """
+        pages = kline_pages(interval, start_time, end_time, limit)
+        with ThreadPoolExecutor(max_workers=min(len(pages), self.config.pool_maxsize)) as executor:
+            results = list(executor.map(lambda page: self.get_klines(symbol, interval, limit, *page), pages))
+        return stitch_klines(symbol, interval, results, start_time, end_time)
+    
     def get_24hr_ticker(self, symbol: Optional[str] = None) -> Union[Dict[str, Any], list]:
         """Get 24-hour price change statistics"""
         params = {}
@@ -250,25 +489,21 @@ class TooBitClient:
     
     def create_order(self, order_request: OrderRequest) -> Dict[str, Any]:
         """Create Order"""
+        order_request = self._validate_order(order_request)
         params = order_request.model_dump(exclude_none=True, by_alias=True)
         return self._make_request('POST', '/api/v1/spot/order', params, signed=True)
     
     def batch_create_orders(self, order_requests: list[OrderRequest]) -> Dict[str, Any]:
         """Batch Create Order"""
+        order_requests = self._validate_orders(order_requests)
         # Convert multiple order requests to parameters list
         orders_data = []
         for order_request in order_requests:
             order_data = order_request.model_dump(exclude_none=True, by_alias=True)
             orders_data.append(order_data)
         
-        # Build request body
-        import json
-        request_body = json.dumps(orders_data)
-        
-        # Build query string - only contains authentication related parameters
-        params = {}
-        
-        return self._make_request('POST', '/api/v1/spot/batchOrders', params, data=request_body, signed=True)
+        # Lists above batch_order_limit are split into chunks sent concurrently
+        return self._submit_batch('/api/v1/spot/batchOrders', orders_data)
     
     def batch_cancel_spot_orders(self, order_ids: list[str]) -> Dict[str, Any]:
         """Spot Batch Cancel Orders"""
@@ -334,6 +569,21 @@ class TooBitClient:
             params['endTime'] = end_time
         
         return self._make_request('GET', '/api/v1/spot/tradeOrders', params, signed=True)
+    
+    def iter_all_orders(
+        self,
+        symbol: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        page_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all spot orders in a time window, paging by time lazily"""
+        params = {'symbol': symbol}
+        if start_time:
+            params['startTime'] = start_time
+        if end_time:
+            params['endTime'] = end_time
+        return self._iter_history('/api/v1/spot/tradeOrders', PageCursor(params, 'orderId', 'time', page_size))
 
     
     def get_trade_history(
@@ -359,6 +609,24 @@ class TooBitClient:
         response = self._make_request('GET', '/api/v1/account/trades', params, signed=True)
         return response
     
+    def iter_trade_history(
+        self,
+        symbol: str,
+        from_id: Optional[int] = None,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        page_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over spot account trades lazily, forward from ``from_id`` or by time window"""
+        params = {'symbol': symbol}
+        if from_id:
+            params['fromId'] = from_id
+        if start_time:
+            params['startTime'] = start_time
+        if end_time:
+            params['endTime'] = end_time
+        return self._iter_history('/api/v1/account/trades', PageCursor(params, 'id', 'time', page_size, 'fromId'))
+    
     # ==================== FuturesAPI ====================
     
     def transfer_between_accounts(
@@ -386,24 +654,21 @@ class TooBitClient:
     
     def create_futures_order(self, order_request: OrderRequest) -> Dict[str, Any]:
         """Futures Create Order (TRADE)"""
+        order_request = self._validate_order(order_request)
         params = order_request.model_dump(exclude_none=True, by_alias=True)
         return self._make_request('POST', '/api/v1/futures/order', params, signed=True)
 
     def batch_create_futures_orders(self, order_requests: list[FuturesOrderRequest]) -> Dict[str, Any]:
         """Futures Batch Create Order (TRADE)"""
+        order_requests = self._validate_orders(order_requests)
         # Convert multiple order requests to parameters list
         orders_data = []
         for order_request in order_requests:
             order_data = order_request.model_dump(exclude_none=True, by_alias=True)
             orders_data.append(order_data)
         
-        # Build request body - directly is order array
-        request_body = json.dumps(orders_data)
-        
-        # Build query string - only contains authentication related parameters
-        params = {}
-        
-        return self._make_request('POST', '/api/v1/futures/batchOrders', params, data=request_body, signed=True)
+        # Lists above batch_order_limit are split into chunks sent concurrently
+        return self._submit_batch('/api/v1/futures/batchOrders', orders_data)
     
 
     
@@ -503,6 +768,11 @@ class TooBitClient:
         params = request.model_dump(exclude_none=True, by_alias=True)
         return self._make_request('GET', '/api/v1/futures/historyOrders', params, signed=True)
 
+    def iter_futures_history_orders(self, request: QueryFuturesHistoryOrdersRequest, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterate over historical orders lazily, paging by time window (``request.limit`` is replaced by ``page_size``)"""
+        params = request.model_dump(exclude_none=True, by_alias=True)
+        return self._iter_history('/api/v1/futures/historyOrders', PageCursor(params, 'orderId', 'time', page_size))
+
     def get_futures_balance(self) -> list:
         """Query Futures Account Balance (USER_DATA)"""
         return self._make_request('GET', '/api/v1/futures/balance', {}, signed=True)
@@ -517,11 +787,21 @@ class TooBitClient:
         params = request.model_dump(exclude_none=True, by_alias=True)
         return self._make_request('GET', '/api/v1/futures/userTrades', params, signed=True)
 
+    def iter_futures_trade_history(self, request: QueryFuturesTradeHistoryRequest, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterate over futures trades lazily, forward from ``request.fromId`` or by time window"""
+        params = request.model_dump(exclude_none=True, by_alias=True)
+        return self._iter_history('/api/v1/futures/userTrades', PageCursor(params, 'id', 'time', page_size, 'fromId'))
+
     def get_futures_account_flow(self, request: QueryFuturesAccountFlowRequest) -> list:
         """Query Futures Account Flow (USER_DATA)"""
         params = request.model_dump(exclude_none=True, by_alias=True)
         return self._make_request('GET', '/api/v1/futures/balanceFlow', params, signed=True)
 
+    def iter_futures_account_flow(self, request: QueryFuturesAccountFlowRequest, page_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Iterate over futures account flow records lazily, forward from ``request.fromId`` or by time window"""
+        params = request.model_dump(exclude_none=True, by_alias=True)
+        return self._iter_history('/api/v1/futures/balanceFlow', PageCursor(params, 'id', 'created', page_size, 'fromId'))
+
     def get_futures_user_fee_rate(self, request: QueryFuturesUserFeeRateRequest) -> Dict[str, Any]:
         """Query Futures User Fee Rate (USER_DATA)"""
         params = request.model_dump(exclude_none=True, by_alias=True)
@@ -612,8 +892,13 @@ class TooBitClient:
     
     def close(self):
         """Close client"""
+        self._trade_keepalive_stop.set()
+        if self.clock is not None:
+            self.clock.stop()
         if self.session:
             self.session.close()
+        if self.trade_session:
+            self.trade_session.close()
     
     def __enter__(self):
         return self
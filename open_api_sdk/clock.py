@@ -0,0 +1,110 @@
+"""
+TooBit API server clock offset estimation
+"""
+
+import collections
+import threading
+import time
+from typing import Any, Callable, Optional
+
+
+class ServerClock:
+    """NTP-style estimator of the offset between the local and server clocks
+
+    Each sample brackets a ``/quote/v1/time`` call with local timestamps and
+    assumes the server stamped its reply at the round-trip midpoint. The
+    lowest-RTT sample of a small window carries the least asymmetry error, so
+    its offset is fed into an exponential moving average.
+    """
+
+    def __init__(self, smoothing: float = 0.3, window: int = 8):
+        self.smoothing = smoothing
+        self.offset_ms: float = 0.0
+        self.rtt_ms: Optional[float] = None
+        self._samples = collections.deque(maxlen=window)
+        self._synced = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def synced(self) -> bool:
+        """Whether at least one sample has been taken"""
+        return self._synced
+
+    def now_ms(self) -> int:
+        """Current server time estimate in milliseconds"""
+        return int(time.time() * 1000 + self.offset_ms)
+
+    def observe(self, sent_ms: float, server_ms: float, rtt_ms: float) -> None:
+        """Record one sample: local send time, server timestamp and round-trip time"""
+        with self._lock:
+            self._samples.append((rtt_ms, server_ms - (sent_ms + rtt_ms / 2)))
+            best_rtt, best_offset = min(self._samples)
+            if self._synced:
+                self.offset_ms += self.smoothing * (best_offset - self.offset_ms)
+            else:
+                self.offset_ms = best_offset
+                self._synced = True
+            self.rtt_ms = best_rtt
+
+    def recommended_recv_window(self, margin_ms: int = 100) -> int:
+        """Smallest recvWindow that tolerates the observed latency and offset error"""
+        with self._lock:
+            if not self._samples:
+                raise ValueError("No clock samples taken yet")
+            worst_rtt = max(rtt for rtt, _ in self._samples)
+        return min(60000, int(worst_rtt + margin_ms))
+
+    def sample(self, fetch_server_time: Callable[[], Any], before: Optional[Callable[[], Any]] = None) -> None:
+        """Take one sample using a callable that returns the ``/quote/v1/time`` response
+
+        ``before`` runs ahead of the timing, so waits such as rate limiting
+        are not counted as round-trip time.
+        """
+        if before is not None:
+            before()
+        sent_ms = time.time() * 1000
+        started = time.perf_counter()
+        response = fetch_server_time()
+        rtt_ms = (time.perf_counter() - started) * 1000
+        self.observe(sent_ms, float(response['serverTime']), rtt_ms)
+
+    async def sample_async(self, fetch_server_time: Callable[[], Any], before: Optional[Callable[[], Any]] = None) -> None:
+        """Take one sample using a coroutine function that returns the ``/quote/v1/time`` response
+
+        ``before`` is awaited ahead of the timing, see ``sample``.
+        """
+        if before is not None:
+            await before()
+        sent_ms = time.time() * 1000
+        started = time.perf_counter()
+        response = await fetch_server_time()
+        rtt_ms = (time.perf_counter() - started) * 1000
+        self.observe(sent_ms, float(response['serverTime']), rtt_ms)
+
+    def start(self, fetch_server_time: Callable[[], Any], interval: float = 30.0,
+              before: Optional[Callable[[], Any]] = None) -> None:
+        """Sample in a daemon thread every ``interval`` seconds"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.sample(fetch_server_time, before)
+                except Exception:
+                    # Keep the last estimate, the next tick will try again
+                    pass
+                self._stop.wait(interval)
+
+        self._thread = threading.Thread(target=run, name="toobit-clock", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background sampling thread"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
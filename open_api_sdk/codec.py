@@ -0,0 +1,81 @@
+"""
+TooBit API JSON codecs
+"""
+
+import json
+from typing import Any, Dict, Type, Union
+
+
+class JsonCodec:
+    """Standard library JSON codec
+
+    Codecs encode request bodies straight to bytes and decode response bodies
+    from bytes, so payloads are never round-tripped through ``str``.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize an object to compact JSON bytes"""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Deserialize JSON bytes, raises ValueError on invalid input"""
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """orjson codec (pip install orjson)"""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class UjsonCodec(JsonCodec):
+    """ujson codec (pip install ujson)"""
+
+    name = "ujson"
+
+    def __init__(self):
+        import ujson
+        self._ujson = ujson
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._ujson.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._ujson.loads(data)
+
+
+CODECS: Dict[str, Type[JsonCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    UjsonCodec.name: UjsonCodec,
+}
+
+# Preference order for the "auto" codec
+AUTO_CODECS = (OrjsonCodec.name, UjsonCodec.name, JsonCodec.name)
+
+
+def get_codec(name: str) -> JsonCodec:
+    """Create a codec by name, "auto" picks the fastest installed one"""
+    if name == "auto":
+        for candidate in AUTO_CODECS:
+            try:
+                return CODECS[candidate]()
+            except ImportError:
+                continue
+    try:
+        codec_class = CODECS[name]
+    except KeyError:
+        raise ValueError(f"Unsupported JSON codec: {name}, expected auto or one of {sorted(CODECS)}")
+    return codec_class()
@@ -22,14 +22,46 @@ class TooBitConfig(BaseModel):
     # Request Configuration
     timeout: int = Field(default=30, description="Request timeout time (seconds)")
     recv_window: int = Field(default=5000, description="Receive window time (milliseconds)")
+    json_codec: str = Field(default="json", description="JSON codec for request bodies and responses (json, orjson, ujson, auto)")
+    
+    # Server clock synchronization
+    time_sync: bool = Field(default=False, description="Stamp signed requests with the estimated server time")
+    time_sync_interval: float = Field(default=30.0, description="Server clock sampling interval (seconds)")
+    
+    # Symbol registry configuration
+    exchange_info_ttl: float = Field(default=300.0, description="Time to live of the cached exchangeInfo symbol registry (seconds)")
+    order_validation: Optional[str] = Field(default=None, description="Validate orders locally against symbol filters: round, reject, or disabled when empty")
+    
+    # Order batching configuration
+    batch_order_limit: int = Field(default=20, description="Maximum number of orders in one batchOrders request")
+    order_batch_window: float = Field(default=0.005, description="How long OrderBatcher collects orders before sending a batch (seconds)")
+    
+    # Connection pool configuration
+    pool_connections: int = Field(default=10, description="Number of host connection pools to cache")
+    pool_maxsize: int = Field(default=10, description="Maximum connections kept per host pool, also the default warmup size")
+    pool_block: bool = Field(default=False, description="Wait for a free pooled connection instead of opening a throwaway one")
+    tcp_keepalive: bool = Field(default=True, description="Enable TCP keepalive probes on pooled connections")
+    pool_keepalive_timeout: float = Field(default=60.0, description="Idle time before the async client closes a pooled connection (seconds)")
+    
+    # Trade lane: order placement and cancellation use their own small connection pool
+    trade_pool_maxsize: int = Field(default=4, description="Maximum connections kept in the trade lane pool")
+    trade_timeout: Optional[float] = Field(default=None, description="Trade lane request timeout (seconds), defaults to timeout")
+    trade_keepalive_interval: float = Field(default=0.0, description="Ping over the trade lane this often to keep it warm (seconds), 0 disables")
     
     # Retry configuration
     max_retries: int = Field(default=3, description="Maximum retry count")
     retry_delay: float = Field(default=1.0, description="Retry delay (seconds)")
+    retry_max_delay: float = Field(default=30.0, description="Maximum backoff delay between retries (seconds)")
     
     # Rate limit configuration
     request_weight_limit: int = Field(default=1200, description="Request weight limit")
     orders_limit: int = Field(default=10, description="Order Limit")
+    rate_limit_enabled: bool = Field(default=True, description="Wait client-side instead of exceeding the rate limits")
+    coalesce_requests: bool = Field(default=False, description="Share one in-flight request among identical concurrent unsigned GETs")
+    
+    # Logging configuration
+    log_level: Optional[str] = Field(default=None, description="Level of the open_api_sdk logger (DEBUG, INFO, WARNING, ...), unchanged when empty")
+    log_sample_interval: float = Field(default=1.0, description="Log each repeated request error at most once per interval (seconds), 0 logs all")
     
     @classmethod
     def from_env(cls) -> "TooBitConfig":
@@ -40,8 +72,16 @@ class TooBitConfig(BaseModel):
             base_url=os.getenv("TOOBIT_BASE_URL", "https://api.test1.wcsbapp.com"),
             timeout=int(os.getenv("TOOBIT_TIMEOUT", "30")),
             recv_window=int(os.getenv("TOOBIT_RECV_WINDOW", "5000")),
+            json_codec=os.getenv("TOOBIT_JSON_CODEC", "json"),
+            log_level=os.getenv("TOOBIT_LOG_LEVEL") or None,
+            time_sync=os.getenv("TOOBIT_TIME_SYNC", "false").lower() in ("1", "true", "yes"),
+            time_sync_interval=float(os.getenv("TOOBIT_TIME_SYNC_INTERVAL", "30.0")),
+            pool_maxsize=int(os.getenv("TOOBIT_POOL_MAXSIZE", "10")),
+            trade_pool_maxsize=int(os.getenv("TOOBIT_TRADE_POOL_MAXSIZE", "4")),
+            trade_timeout=float(os.getenv("TOOBIT_TRADE_TIMEOUT")) if os.getenv("TOOBIT_TRADE_TIMEOUT") else None,
             max_retries=int(os.getenv("TOOBIT_MAX_RETRIES", "3")),
             retry_delay=float(os.getenv("TOOBIT_RETRY_DELAY", "1.0")),
+            retry_max_delay=float(os.getenv("TOOBIT_RETRY_MAX_DELAY", "30.0")),
         )
     
     def validate(self) -> bool:
@@ -8,10 +8,19 @@ from typing import Optional, Dict, Any
 class TooBitException(Exception):
     """TooBit API base exception class"""
     
-    def __init__(self, message: str, code: Optional[int] = None, response: Optional[Dict[str, Any]] = None):
+    def __init__(
+        self,
+        message: str,
+        code: Optional[int] = None,
+        response: Optional[Dict[str, Any]] = None,
+        status_code: Optional[int] = None,
+        endpoint: Optional[str] = None
+    ):
         self.message = message
         self.code = code
         self.response = response or {}
+        self.status_code = status_code
+        self.endpoint = endpoint
         super().__init__(self.message)
 
 
@@ -225,24 +234,27 @@ def get_error_message(code: int) -> str:
     return ERROR_CODE_MAP.get(code, f"Unknown errorCode: {code}")
 
 
-def raise_toobit_exception(code: int, message: str, response: Optional[Dict[str, Any]] = None):
-    """Raise corresponding exception based on error code"""
-    error_message = f"{get_error_message(code)}: {message}"
+def raise_toobit_exception(
+    code: int,
+    message: str,
+    response: Optional[Dict[str, Any]] = None,
+    status_code: Optional[int] = None
+):
+    """Raise corresponding exception based on error code
     
-    # Print detailed error information
-    print(f"Error Details: {error_message}")
-    if response:
-        print(f"Error response data: {response}")
+    The error details stay on the exception (``code``, ``response``, ``status_code``) for the caller to inspect.
+    """
+    error_message = f"{get_error_message(code)}: {message}"
     
     if code in [-1001, -1002, -1003, -1006, -1007]:
-        raise NetworkError(error_message, code, response)
+        raise NetworkError(error_message, code, response, status_code)
     elif code in [-1016, -2014, -2015]:
-        raise AuthenticationError(error_message, code, response)
+        raise AuthenticationError(error_message, code, response, status_code)
     elif code in [-1004, -1008, -1009, -1010, -1011, -1012, -1013, -1014, -1015, -1017, -1018]:
-        raise ValidationError(error_message, code, response)
+        raise ValidationError(error_message, code, response, status_code)
     elif code in [-1143, -1144, -1145, -1146, -1147, -1193, -1194, -1195, -1196, -1197, -1198, -1199, -1200, -1201, -1202, -1203, -1206, -2010, -2011, -2013, -2016]:
-        raise OrderError(error_message, code, response)
+        raise OrderError(error_message, code, response, status_code)
     elif code == -1005:  # Rate limit
-        raise RateLimitError(error_message, code, response)
+        raise RateLimitError(error_message, code, response, status_code)
     else:
-        raise APIError(error_message, code, response) 
\ No newline at end of file
+        raise APIError(error_message, code, response, status_code) 
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+TooBit API memory-mapped on-disk kline cache (requires numpy)
+"""
+
+import os
+import re
+from typing import Dict, Optional
+
+from .klines import KLINE_COLUMNS, KlineStore, np, require_numpy
+
+# File layout: 64-byte header (magic, candle count, capacity), then one
+# ``capacity``-long 8-byte column per KLINE_COLUMNS entry, in that order
+MAGIC = b"TBKLINE1"
+HEADER_SIZE = 64
+COLUMN_ITEMSIZE = 8
+INITIAL_CAPACITY = 4096
+
+
+def _file_size(capacity: int) -> int:
+    return HEADER_SIZE + capacity * COLUMN_ITEMSIZE * len(KLINE_COLUMNS)
+
+
+def _write_empty(path: str, capacity: int) -> None:
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(np.array([0, capacity], dtype=np.int64).tobytes())
+        f.truncate(_file_size(capacity))
+
+
+class MappedKlineStore(KlineStore):
+    """``KlineStore`` whose columns live in a memory-mapped file
+
+    Readers (``writable=False``) map the file read-only, so every process
+    shares the operating system's page cache instead of holding a private
+    copy; call ``reload()`` to see candles appended by the writer since. The
+    writer appends through ``update``/``refresh`` and records the new count
+    in the header after the data is written. A file that runs out of
+    capacity is rewritten at twice the size and swapped in with
+    ``os.replace``, so open readers keep a consistent view of the old file.
+    """
+
+    def __init__(self, path: str, client=None, symbol: Optional[str] = None, interval: str = '1m',
+                 writable: bool = False):
+        require_numpy()
+        super().__init__(client, symbol, interval, capacity=0)
+        self.path = path
+        self.writable = writable
+        self._stat = None
+        if writable and not os.path.exists(path):
+            _write_empty(path, INITIAL_CAPACITY)
+        self._map()
+
+    def _map(self) -> None:
+        self._mmap = np.memmap(self.path, dtype=np.uint8, mode='r+' if self.writable else 'r')
+        if bytes(self._mmap[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f"Not a kline cache file: {self.path}")
+        self._header = np.ndarray(2, dtype=np.int64, buffer=self._mmap, offset=len(MAGIC))
+        capacity = int(self._header[1])
+        self._columns = {
+            name: np.ndarray(capacity, dtype=dtype, buffer=self._mmap,
+                             offset=HEADER_SIZE + index * capacity * COLUMN_ITEMSIZE)
+            for index, (name, _, dtype) in enumerate(KLINE_COLUMNS)
+        }
+        self._size = int(self._header[0])
+        self._stat = os.stat(self.path)
+
+    def reload(self) -> int:
+        """Pick up candles written by another process, returning the current count"""
+        stat = os.stat(self.path)
+        if (stat.st_ino, stat.st_size) != (self._stat.st_ino, self._stat.st_size):
+            self._map()
+        else:
+            self._size = int(self._header[0])
+        return self._size
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._columns['open_time'])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        tmp_path = f"{self.path}.tmp"
+        _write_empty(tmp_path, capacity)
+        grown = np.memmap(tmp_path, dtype=np.uint8, mode='r+')
+        for index, (name, _, dtype) in enumerate(KLINE_COLUMNS):
+            column = np.ndarray(capacity, dtype=dtype, buffer=grown, offset=HEADER_SIZE + index * capacity * COLUMN_ITEMSIZE)
+            column[:self._size] = self._columns[name][:self._size]
+        np.ndarray(1, dtype=np.int64, buffer=grown, offset=len(MAGIC))[0] = self._size
+        grown.flush()
+        del grown
+        os.replace(tmp_path, self.path)
+        self._map()
+
+    def update_columns(self, columns: Dict[str, "np.ndarray"]) -> int:
+        if not self.writable:
+            raise PermissionError(f"Kline cache {self.path} is open read-only")
+        added = super().update_columns(columns)
+        # Publish the count only after the candles themselves are in place
+        self._mmap.flush()
+        self._header[0] = self._size
+        self._mmap.flush()
+        return added
+
+
+class KlineCache:
+    """Directory of memory-mapped kline files, one per symbol and interval
+
+    ``open`` maps a file for zero-copy reading. ``sync`` (one writer per file)
+    fetches only the candles after the last cached one, starting the file at
+    ``start_time`` through ``fetch_klines`` or with the latest ``get_klines``
+    page when it is new.
+    """
+
+    def __init__(self, directory: str, client=None):
+        require_numpy()
+        self.directory = directory
+        self.client = client
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, symbol: str, interval: str) -> str:
+        safe_symbol = re.sub(r"[^A-Za-z0-9_.-]", "_", symbol)
+        return os.path.join(self.directory, f"{safe_symbol}_{interval}.klines")
+
+    def open(self, symbol: str, interval: str, writable: bool = False) -> MappedKlineStore:
+        """Map the cache file of a symbol/interval, read-only unless ``writable``"""
+        return MappedKlineStore(self.path(symbol, interval), self.client, symbol, interval, writable=writable)
+
+    def sync(self, symbol: str, interval: str, start_time: Optional[int] = None) -> MappedKlineStore:
+        """Append the candles the exchange has beyond the cache, returning the writable store"""
+        if self.client is None:
+            raise ValueError("KlineCache needs a client to sync")
+        store = self.open(symbol, interval, writable=True)
+        if len(store) == 0 and start_time is not None:
+            end_time = self.client.get_server_time()['serverTime']
+            store.update_columns(self.client.fetch_klines(symbol, interval, start_time, end_time).columns())
+        store.refresh()
+        return store
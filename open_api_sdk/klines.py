@@ -0,0 +1,299 @@
+"""
+TooBit API columnar kline storage (requires numpy: pip install toobit-api-sdk[numpy])
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .log import logger
+
+
+# Interval lengths in milliseconds; monthly candles vary in length and are left out
+INTERVAL_MS = {
+    '1m': 60_000,
+    '3m': 3 * 60_000,
+    '5m': 5 * 60_000,
+    '15m': 15 * 60_000,
+    '30m': 30 * 60_000,
+    '1h': 3_600_000,
+    '2h': 2 * 3_600_000,
+    '4h': 4 * 3_600_000,
+    '6h': 6 * 3_600_000,
+    '8h': 8 * 3_600_000,
+    '12h': 12 * 3_600_000,
+    '1d': 86_400_000,
+    '1w': 7 * 86_400_000,
+}
+
+# Column name, position in a get_klines row, dtype
+KLINE_COLUMNS = (
+    ('open_time', 0, 'int64'),
+    ('open', 1, 'float64'),
+    ('high', 2, 'float64'),
+    ('low', 3, 'float64'),
+    ('close', 4, 'float64'),
+    ('volume', 5, 'float64'),
+    ('close_time', 6, 'int64'),
+    ('quote_volume', 7, 'float64'),
+    ('trades', 8, 'int64'),
+)
+
+# Maximum candles returned by one get_klines call
+MAX_KLINES_LIMIT = 1000
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise ImportError("Columnar klines require numpy: pip install toobit-api-sdk[numpy]")
+
+
+def interval_ms(interval: str) -> int:
+    """Length of a kline interval in milliseconds"""
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported kline interval: {interval}, expected one of {list(INTERVAL_MS)}")
+
+
+def parse_klines(rows: Sequence[Sequence[Any]]) -> Dict[str, "np.ndarray"]:
+    """Convert get_klines rows into one NumPy array per column"""
+    require_numpy()
+    if len(rows) == 0:
+        return {name: np.empty(0, dtype=dtype) for name, _, dtype in KLINE_COLUMNS}
+    width = len(KLINE_COLUMNS)
+    # Prices arrive as strings; one float conversion for the whole table is far cheaper than per cell
+    table = np.array([row[:width] for row in rows], dtype=object).astype(np.float64)
+    return {name: table[:, index].astype(dtype) for name, index, dtype in KLINE_COLUMNS}
+
+
+class KlineStore:
+    """Candles of one symbol and interval held as NumPy column arrays
+
+    ``refresh()`` loads ``limit`` candles on first use and afterwards fetches
+    only the candles since the last one, overwriting the still-forming last
+    candle in place and appending the rest. Columns (``open_time``, ``open``,
+    ``high``, ``low``, ``close``, ``volume``, ``close_time``,
+    ``quote_volume``, ``trades``) are exposed as zero-copy views; a view
+    taken before an append that grows the buffers keeps showing the old data.
+    ``gaps`` lists the (first, last) open times of candles missing from a
+    ``fetch_klines`` range.
+    """
+
+    def __init__(self, client=None, symbol: Optional[str] = None, interval: str = '1m',
+                 limit: int = MAX_KLINES_LIMIT, capacity: int = 1024):
+        require_numpy()
+        self.client = client
+        self.symbol = symbol
+        self.interval = interval
+        self.limit = limit
+        self.gaps: List[Tuple[int, int]] = []
+        self._size = 0
+        self._columns = {name: np.empty(capacity, dtype=dtype) for name, _, dtype in KLINE_COLUMNS}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getattr__(self, name: str) -> "np.ndarray":
+        columns = self.__dict__.get('_columns')
+        if columns is not None and name in columns:
+            return columns[name][:self._size]
+        raise AttributeError(name)
+
+    def column(self, name: str) -> "np.ndarray":
+        """Zero-copy view of a column"""
+        return self._columns[name][:self._size]
+
+    def columns(self) -> Dict[str, "np.ndarray"]:
+        """Zero-copy views of all columns"""
+        return {name: values[:self._size] for name, values in self._columns.items()}
+
+    @property
+    def last_open_time(self) -> Optional[int]:
+        return int(self._columns['open_time'][self._size - 1]) if self._size else None
+
+    @property
+    def last_close_time(self) -> Optional[int]:
+        return int(self._columns['close_time'][self._size - 1]) if self._size else None
+
+    def between(self, start_time: Optional[int] = None, end_time: Optional[int] = None) -> Dict[str, "np.ndarray"]:
+        """Zero-copy views of the candles opening in [start_time, end_time]"""
+        open_time = self._columns['open_time'][:self._size]
+        start = 0 if start_time is None else int(np.searchsorted(open_time, start_time, side='left'))
+        end = self._size if end_time is None else int(np.searchsorted(open_time, end_time, side='right'))
+        return {name: values[start:end] for name, values in self._columns.items()}
+
+    def _reserve(self, size: int) -> None:
+        capacity = len(self._columns['open_time'])
+        if size <= capacity:
+            return
+        capacity = max(size, capacity * 2)
+        for name, values in self._columns.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self._size] = values[:self._size]
+            self._columns[name] = grown
+
+    def update(self, rows: Sequence[Sequence[Any]]) -> int:
+        """Merge get_klines rows (oldest first), returning the number of candles appended
+
+        Rows older than the last stored candle are ignored, a row for the last
+        stored candle replaces it in place.
+        """
+        return self.update_columns(parse_klines(rows))
+
+    def update_columns(self, columns: Dict[str, "np.ndarray"]) -> int:
+        """Merge already parsed columns, see ``update``"""
+        open_time = columns['open_time']
+        last_open_time = self.last_open_time
+        if last_open_time is not None:
+            start = int(np.searchsorted(open_time, last_open_time, side='left'))
+            if start < len(open_time) and open_time[start] == last_open_time:
+                # The still-forming candle: patch it in place
+                for name, values in self._columns.items():
+                    values[self._size - 1] = columns[name][start]
+                start += 1
+            columns = {name: values[start:] for name, values in columns.items()}
+        added = len(columns['open_time'])
+        if added:
+            self._reserve(self._size + added)
+            for name, values in self._columns.items():
+                values[self._size:self._size + added] = columns[name]
+            self._size += added
+        return added
+
+    def refresh(self) -> int:
+        """Fetch new candles through the client, returning the number appended"""
+        if self.client is None or self.symbol is None:
+            raise ValueError("KlineStore needs a client and symbol to refresh, use update() instead")
+        if self._size == 0:
+            return self.update(self.client.get_klines(self.symbol, self.interval, self.limit))
+        added = 0
+        while True:
+            # Start at the last stored candle so the still-forming one is patched too
+            rows = self.client.get_klines(self.symbol, self.interval, MAX_KLINES_LIMIT, self.last_open_time)
+            page_added = self.update(rows)
+            added += page_added
+            if len(rows) < MAX_KLINES_LIMIT or page_added == 0:
+                return added
+
+
+def bucket_open_time(open_time: "np.ndarray", interval: str) -> "np.ndarray":
+    """Open time of the ``interval`` candle each timestamp falls in, aligned like the exchange
+
+    Candles up to 1d start at UTC multiples of their length, weekly candles on Monday 00:00 UTC.
+    """
+    length = interval_ms(interval)
+    # 1970-01-01 was a Thursday, the first Monday is four days later
+    offset = 4 * INTERVAL_MS['1d'] if interval == '1w' else 0
+    return (open_time - offset) // length * length + offset
+
+
+def resample(columns: Dict[str, "np.ndarray"], interval: str) -> Dict[str, "np.ndarray"]:
+    """Aggregate candles (oldest first) into a higher ``interval``
+
+    Open is the first, high the max, low the min and close the last value of
+    each bucket; volumes and trade counts are summed. A bucket only partly
+    covered by the input (typically the first and the still-forming last one)
+    aggregates the candles that are there.
+    """
+    require_numpy()
+    open_time = columns['open_time']
+    if len(open_time) == 0:
+        return {name: np.empty(0, dtype=dtype) for name, _, dtype in KLINE_COLUMNS}
+    buckets = bucket_open_time(open_time, interval)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))
+    ends = np.append(starts[1:], len(buckets)) - 1
+    return {
+        'open_time': buckets[starts],
+        'open': columns['open'][starts],
+        'high': np.maximum.reduceat(columns['high'], starts),
+        'low': np.minimum.reduceat(columns['low'], starts),
+        'close': columns['close'][ends],
+        'volume': np.add.reduceat(columns['volume'], starts),
+        'close_time': buckets[starts] + interval_ms(interval) - 1,
+        'quote_volume': np.add.reduceat(columns['quote_volume'], starts),
+        'trades': np.add.reduceat(columns['trades'], starts),
+    }
+
+
+def kline_pages(interval: str, start_time: int, end_time: int, limit: int = MAX_KLINES_LIMIT) -> List[Tuple[int, int]]:
+    """(startTime, endTime) of the get_klines pages covering [start_time, end_time], ``limit`` candles each"""
+    require_numpy()
+    if start_time > end_time:
+        raise ValueError(f"start_time {start_time} is after end_time {end_time}")
+    first = int(bucket_open_time(np.int64(start_time), interval))
+    span = interval_ms(interval) * limit
+    return [(page_start, min(end_time, page_start + span - 1)) for page_start in range(first, end_time + 1, span)]
+
+
+def find_gaps(open_time: "np.ndarray", interval: str, start_time: int, end_time: int) -> List[Tuple[int, int]]:
+    """(first, last) open times of each run of candles missing from ``open_time`` in [start_time, end_time]"""
+    length = interval_ms(interval)
+    first = int(bucket_open_time(np.int64(start_time), interval))
+    if first < start_time:
+        first += length
+    expected = np.arange(first, end_time + 1, length, dtype=np.int64)
+    missing = expected[~np.isin(expected, open_time)]
+    if len(missing) == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(missing) != length)
+    starts = np.concatenate(([0], breaks + 1))
+    ends = np.append(breaks, len(missing) - 1)
+    return [(int(missing[start]), int(missing[end])) for start, end in zip(starts, ends)]
+
+
+def stitch_klines(symbol: str, interval: str, pages: List[Sequence[Sequence[Any]]],
+                  start_time: int, end_time: int) -> KlineStore:
+    """Join get_klines pages into one ``KlineStore`` sorted by open time, recording gaps"""
+    columns = [parse_klines(page) for page in pages]
+    merged = {name: np.concatenate([page[name] for page in columns]) for name, _, _ in KLINE_COLUMNS}
+    # Pages may overlap on their boundary candle and arrive in any order
+    open_time, index = np.unique(merged['open_time'], return_index=True)
+    keep = (open_time >= start_time) & (open_time <= end_time)
+    index = index[keep]
+    store = KlineStore(symbol=symbol, interval=interval, capacity=max(1, len(index)))
+    store.update_columns({name: values[index] for name, values in merged.items()})
+    # Candles that cannot have opened yet are not missing
+    now = int(time.time() * 1000)
+    store.gaps = find_gaps(store.open_time, interval, start_time, min(end_time, now))
+    if store.gaps:
+        logger.warning("%s %s klines missing for %d interval ranges between %s and %s",
+                       symbol, interval, len(store.gaps), start_time, end_time)
+    return store
+
+
+class KlineResampler:
+    """Higher-interval candles derived from a 1m (or any finer) ``KlineStore``
+
+    ``update()`` re-aggregates only the source candles from the last derived
+    candle onwards, so the still-forming candle is patched in place and
+    completed ones are appended. One source store can feed several
+    resamplers, replacing a get_klines call per interval.
+    """
+
+    def __init__(self, source: KlineStore, interval: str):
+        if interval_ms(interval) <= interval_ms(source.interval):
+            raise ValueError(f"Cannot resample {source.interval} candles into {interval}")
+        self.source = source
+        self.interval = interval
+        self.store = KlineStore(symbol=source.symbol, interval=interval, capacity=max(16, len(source) // 2))
+
+    def update(self) -> int:
+        """Fold new source candles into the derived ones, returning the number appended"""
+        last_open_time = self.store.last_open_time
+        columns = self.source.columns() if last_open_time is None else self.source.between(last_open_time)
+        return self.store.update_columns(resample(columns, self.interval))
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getattr__(self, name: str) -> "np.ndarray":
+        # Column views (close, volume, ...) come from the derived store
+        store = self.__dict__.get('store')
+        if store is None:
+            raise AttributeError(name)
+        return getattr(store, name)
@@ -0,0 +1,55 @@
+"""
+TooBit API SDK logging
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+
+logger = logging.getLogger("open_api_sdk")
+logger.addHandler(logging.NullHandler())
+
+
+class SamplingFilter(logging.Filter):
+    """Rate limit repeated log records
+
+    Records logged with ``extra={"sample_key": ...}`` are let through at most
+    once per ``interval`` seconds per key; the next record that passes reports
+    how many similar records were dropped. Records without a key always pass.
+    """
+
+    def __init__(self, interval: float = 1.0):
+        super().__init__()
+        self.interval = interval
+        self._windows: Dict[Hashable, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        key = getattr(record, "sample_key", None)
+        if key is None or self.interval <= 0:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            last, suppressed = self._windows.get(key, (None, 0))
+            if last is not None and now - last < self.interval:
+                self._windows[key] = (last, suppressed + 1)
+                return False
+            self._windows[key] = (now, 0)
+        if suppressed:
+            record.msg = f"{record.msg} (%d similar suppressed)"
+            record.args = tuple(record.args or ()) + (suppressed,)
+        return True
+
+
+sampling_filter = SamplingFilter()
+logger.addFilter(sampling_filter)
+
+
+def configure_logging(level: Optional[Union[int, str]] = None, sample_interval: Optional[float] = None) -> None:
+    """Set the SDK log level and the repeated-error sampling interval (0 disables sampling)"""
+    if level is not None:
+        logger.setLevel(level.upper() if isinstance(level, str) else level)
+    if sample_interval is not None:
+        sampling_filter.interval = sample_interval
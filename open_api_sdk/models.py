@@ -652,6 +652,31 @@ class ExchangeInfo(BaseModel):
     model_config = ConfigDict()
 
 
+class SymbolFilters(BaseModel):
+    """Pre-parsed trading filters of one symbol or contract from exchangeInfo"""
+    symbol: str = Field(..., description="Symbol")
+    status: Optional[str] = Field(None, description="Trading status")
+    base_asset: Optional[str] = Field(None, description="Base asset")
+    quote_asset: Optional[str] = Field(None, description="Quote asset")
+    is_contract: bool = Field(False, description="Whether is a futures contract")
+    tick_size: Optional[float] = Field(None, description="Price step")
+    price_precision: int = Field(0, description="Price decimal places")
+    min_price: Optional[float] = Field(None, description="Minimum price")
+    max_price: Optional[float] = Field(None, description="Maximum price")
+    step_size: Optional[float] = Field(None, description="Quantity step")
+    quantity_precision: int = Field(0, description="Quantity decimal places")
+    min_qty: Optional[float] = Field(None, description="Minimum quantity")
+    max_qty: Optional[float] = Field(None, description="Maximum quantity")
+    min_notional: Optional[float] = Field(None, description="Minimum order notional")
+    min_amount: Optional[float] = Field(None, description="Minimum order amount")
+    max_amount: Optional[float] = Field(None, description="Maximum order amount")
+    buy_price_up_rate: Optional[float] = Field(None, description="Maximum limit buy price above last price (rate)")
+    sell_price_down_rate: Optional[float] = Field(None, description="Maximum limit sell price below last price (rate)")
+    contract_multiplier: Optional[float] = Field(None, description="Contract multiplier (futures)")
+    
+    model_config = ConfigDict(frozen=True)
+
+
 class Ticker24hr(BaseModel):
     """24 hour price change model"""
     t: int = Field(..., description="Time")
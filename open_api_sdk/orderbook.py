@@ -0,0 +1,239 @@
+"""
+TooBit API local order book engine (requires numpy)
+"""
+
+from typing import Any, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from .models import OrderBook
+
+
+BID = "bid"
+ASK = "ask"
+
+
+class BookDiff(NamedTuple):
+    """Levels that changed between two snapshots, best price first
+
+    Quantities are the new ones; 0 means the level was removed.
+    """
+    bid_prices: "np.ndarray"
+    bid_quantities: "np.ndarray"
+    ask_prices: "np.ndarray"
+    ask_quantities: "np.ndarray"
+
+    @property
+    def empty(self) -> bool:
+        return len(self.bid_prices) == 0 and len(self.ask_prices) == 0
+
+
+class FillEstimate(NamedTuple):
+    """Expected fill of each target size against the book, NaN where the book is too thin
+
+    Slippage is the average price's distance from the best price in basis
+    points, positive when the fill is worse than the best price.
+    """
+    average_price: "np.ndarray"
+    worst_price: "np.ndarray"
+    slippage_bps: "np.ndarray"
+
+
+def _parse_levels(levels: Sequence[Sequence[Any]], descending: bool) -> Tuple["np.ndarray", "np.ndarray"]:
+    """[[price, qty], ...] (strings or numbers) to price and quantity arrays sorted best first"""
+    table = np.array(levels, dtype=np.float64).reshape(-1, 2)
+    table = table[table[:, 1] > 0]
+    order = np.argsort(-table[:, 0] if descending else table[:, 0], kind='stable')
+    return table[order, 0].copy(), table[order, 1].copy()
+
+
+def _quantities_at(keys: "np.ndarray", quantities: "np.ndarray", lookup: "np.ndarray") -> "np.ndarray":
+    """Quantity at each ``lookup`` key in ascending ``keys``, 0 where there is no level"""
+    index = np.searchsorted(keys, lookup)
+    found = index < len(keys)
+    found[found] = keys[index[found]] == lookup[found]
+    result = np.zeros(len(lookup), dtype=np.float64)
+    result[found] = quantities[index[found]]
+    return result
+
+
+def _diff_side(old_keys: "np.ndarray", old_quantities: "np.ndarray",
+               new_keys: "np.ndarray", new_quantities: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    keys = np.union1d(old_keys, new_keys)
+    before = _quantities_at(old_keys, old_quantities, keys)
+    after = _quantities_at(new_keys, new_quantities, keys)
+    changed = before != after
+    return keys[changed], after[changed]
+
+
+def _walk_levels(prices: "np.ndarray", cumulative_quantity: "np.ndarray", cumulative_notional: "np.ndarray",
+                 sizes: "np.ndarray", quote: bool) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Average and worst price of filling each size from the best level outwards"""
+    average = np.full(len(sizes), np.nan)
+    worst = np.full(len(sizes), np.nan)
+    # Index of the level each fill ends on; sizes beyond the last level stay NaN
+    levels = np.searchsorted(cumulative_notional if quote else cumulative_quantity, sizes, side='left')
+    fillable = levels < len(prices)
+    levels = levels[fillable]
+    sizes = sizes[fillable]
+    last_price = prices[levels]
+    filled_quantity = np.concatenate(([0.0], cumulative_quantity))[levels]
+    filled_notional = np.concatenate(([0.0], cumulative_notional))[levels]
+    # The remainder of each size is taken from the level the fill ends on
+    if quote:
+        notional = sizes
+        quantity = filled_quantity + (sizes - filled_notional) / last_price
+    else:
+        quantity = sizes
+        notional = filled_notional + (sizes - filled_quantity) * last_price
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # A zero size fills at the best price
+        average[fillable] = np.where(quantity > 0, notional / quantity, prices[0] if len(prices) else np.nan)
+    worst[fillable] = last_price
+    return average, worst
+
+
+class OrderBookEngine:
+    """Order book of one symbol held in sorted NumPy arrays
+
+    Both sides are kept best price first (bids descending, asks ascending),
+    so the best bid/ask are O(1) lookups, and depth queries are vectorized
+    ``searchsorted``/``cumsum`` calls over the levels. Each ``load`` /
+    ``refresh`` returns a ``BookDiff`` with only the levels that changed
+    since the previous snapshot.
+    """
+
+    def __init__(self, client=None, symbol: Optional[str] = None, limit: int = 100):
+        if np is None:
+            raise ImportError("OrderBookEngine requires numpy: pip install toobit-api-sdk[numpy]")
+        self.client = client
+        self.symbol = symbol
+        self.limit = limit
+        self.update_id: Optional[int] = None
+        self.bid_prices = np.empty(0, dtype=np.float64)
+        self.bid_quantities = np.empty(0, dtype=np.float64)
+        self.ask_prices = np.empty(0, dtype=np.float64)
+        self.ask_quantities = np.empty(0, dtype=np.float64)
+        self._bid_cumulative: Optional["np.ndarray"] = None
+        self._ask_cumulative: Optional["np.ndarray"] = None
+        self._bid_notional: Optional["np.ndarray"] = None
+        self._ask_notional: Optional["np.ndarray"] = None
+
+    def load(self, snapshot: Union[Dict[str, Any], OrderBook]) -> BookDiff:
+        """Replace the book with a get_order_book snapshot, returning the changed levels"""
+        if isinstance(snapshot, OrderBook):
+            snapshot = snapshot.model_dump()
+        bid_prices, bid_quantities = _parse_levels(snapshot.get('b') or [], descending=True)
+        ask_prices, ask_quantities = _parse_levels(snapshot.get('a') or [], descending=False)
+        # Bids are compared on negated prices so both sides are ascending and best first
+        bid_keys, bid_changes = _diff_side(-self.bid_prices, self.bid_quantities, -bid_prices, bid_quantities)
+        ask_keys, ask_changes = _diff_side(self.ask_prices, self.ask_quantities, ask_prices, ask_quantities)
+        self.bid_prices, self.bid_quantities = bid_prices, bid_quantities
+        self.ask_prices, self.ask_quantities = ask_prices, ask_quantities
+        self._bid_cumulative = self._ask_cumulative = None
+        self._bid_notional = self._ask_notional = None
+        self.update_id = snapshot.get('t')
+        return BookDiff(-bid_keys, bid_changes, ask_keys, ask_changes)
+
+    def refresh(self) -> BookDiff:
+        """Fetch a snapshot through the client and load it"""
+        if self.client is None or self.symbol is None:
+            raise ValueError("OrderBookEngine needs a client and symbol to refresh, use load() instead")
+        return self.load(self.client.get_order_book(self.symbol, self.limit))
+
+    @property
+    def best_bid(self) -> Optional[float]:
+        return float(self.bid_prices[0]) if len(self.bid_prices) else None
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return float(self.ask_prices[0]) if len(self.ask_prices) else None
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return None
+        return float(self.ask_prices[0] - self.bid_prices[0])
+
+    @property
+    def mid_price(self) -> Optional[float]:
+        if not len(self.bid_prices) or not len(self.ask_prices):
+            return None
+        return float(self.ask_prices[0] + self.bid_prices[0]) / 2
+
+    def _side(self, side: str) -> Tuple["np.ndarray", "np.ndarray"]:
+        if side == BID:
+            return self.bid_prices, self.bid_quantities
+        if side == ASK:
+            return self.ask_prices, self.ask_quantities
+        raise ValueError(f"Unsupported book side: {side}, expected {BID} or {ASK}")
+
+    def cumulative_depth(self, side: str) -> "np.ndarray":
+        """Running total of quantity from the best level outwards"""
+        _, quantities = self._side(side)
+        if side == BID:
+            if self._bid_cumulative is None:
+                self._bid_cumulative = np.cumsum(quantities)
+            return self._bid_cumulative
+        if self._ask_cumulative is None:
+            self._ask_cumulative = np.cumsum(quantities)
+        return self._ask_cumulative
+
+    def depth_at(self, side: str, prices: Union[float, Sequence[float], "np.ndarray"]) -> "np.ndarray":
+        """Quantity resting exactly at each price, 0 where there is no level"""
+        book_prices, quantities = self._side(side)
+        prices = np.atleast_1d(np.asarray(prices, dtype=np.float64))
+        if side == BID:
+            return _quantities_at(-book_prices, quantities, -prices)
+        return _quantities_at(book_prices, quantities, prices)
+
+    def depth_within(self, side: str, prices: Union[float, Sequence[float], "np.ndarray"]) -> "np.ndarray":
+        """Total quantity at or better than each price (bids >= price, asks <= price)"""
+        book_prices, _ = self._side(side)
+        prices = np.atleast_1d(np.asarray(prices, dtype=np.float64))
+        if side == BID:
+            levels = np.searchsorted(-book_prices, -prices, side='right')
+        else:
+            levels = np.searchsorted(book_prices, prices, side='right')
+        cumulative = np.concatenate(([0.0], self.cumulative_depth(side)))
+        return cumulative[levels]
+
+    def cumulative_notional(self, side: str) -> "np.ndarray":
+        """Running total of price * quantity from the best level outwards"""
+        prices, quantities = self._side(side)
+        if side == BID:
+            if self._bid_notional is None:
+                self._bid_notional = np.cumsum(prices * quantities)
+            return self._bid_notional
+        if self._ask_notional is None:
+            self._ask_notional = np.cumsum(prices * quantities)
+        return self._ask_notional
+
+    def fill_estimate(
+        self,
+        side: str,
+        sizes: Union[float, Sequence[float], "np.ndarray"],
+        quote: bool = False
+    ) -> FillEstimate:
+        """Average fill price, worst price and slippage of taking each size from one side
+
+        ``side`` is the side consumed: ``"ask"`` for buying, ``"bid"`` for
+        selling. Sizes are base quantities, or quote amounts with
+        ``quote=True``; all of them are answered with one ``searchsorted`` over
+        the cached cumulative depth instead of a walk over the levels per size.
+        """
+        prices, _ = self._side(side)
+        sizes = np.atleast_1d(np.asarray(sizes, dtype=np.float64))
+        if np.any(sizes < 0):
+            raise ValueError("Fill sizes must not be negative")
+        average, worst = _walk_levels(prices, self.cumulative_depth(side), self.cumulative_notional(side), sizes, quote)
+        if len(prices):
+            best = prices[0]
+            # Positive slippage is always a cost: paying above the best ask or selling below the best bid
+            slippage = (average - best) / best * 10_000 if side == ASK else (best - average) / best * 10_000
+        else:
+            slippage = np.full(len(sizes), np.nan)
+        return FillEstimate(average, worst, slippage)
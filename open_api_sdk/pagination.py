@@ -0,0 +1,90 @@
+"""
+TooBit API auto-pagination of history endpoints
+"""
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Set
+
+from .log import logger
+
+
+class PageCursor:
+    """Paging state of one history query
+
+    With ``cursor_param`` (e.g. ``fromId``) set in the initial parameters,
+    pages are walked by record ID: forward, or backward with ``descending``
+    for cursors that return records older than the given ID. Otherwise the ``startTime`` /
+    ``endTime`` window is narrowed after each page towards the records not
+    yet seen, in whichever direction the endpoint sorts its pages
+    (``descending`` reflects the direction detected). Records
+    sharing the boundary ID or timestamp of two pages are yielded once; only
+    those boundary IDs are remembered, so memory stays bounded by one page.
+    """
+
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        id_key: str,
+        time_key: str,
+        page_size: int,
+        cursor_param: Optional[str] = None,
+        descending: bool = False
+    ):
+        self.params = dict(params, limit=page_size)
+        self.id_key = id_key
+        self.time_key = time_key
+        self.page_size = page_size
+        self.cursor_param = cursor_param if cursor_param and params.get(cursor_param) else None
+        self.descending = descending
+        self.done = False
+        self._boundary: Optional[int] = None
+        self._boundary_ids: Set[str] = set()
+
+    def advance(self, page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Records of ``page`` not returned before; moves the cursor to the next page"""
+        if not page:
+            self.done = True
+            return []
+        fresh = [record for record in page if str(record[self.id_key]) not in self._boundary_ids]
+        if len(page) < self.page_size:
+            self.done = True
+        elif not fresh:
+            # A full page of already seen records: more records share one boundary than fit a page
+            logger.warning("Pagination stopped at %s=%s: more records share it than fit a page, some may be missing", self.time_key, self._boundary)
+            self.done = True
+
+        if self.cursor_param:
+            ids = [int(record[self.id_key]) for record in page]
+            boundary = min(ids) if self.descending else max(ids)
+            if boundary == self._boundary and not self.done:
+                # The cursor did not move, the next page would be this one again
+                logger.warning("Pagination stopped at %s=%s: the %s cursor did not advance", self.id_key, boundary, self.cursor_param)
+                self.done = True
+            self.params[self.cursor_param] = boundary
+            boundary_ids = {str(boundary)}
+        else:
+            times = [int(record[self.time_key]) for record in page]
+            descending = self.descending = times[0] >= times[-1]
+            boundary = min(times) if descending else max(times)
+            self.params['endTime' if descending else 'startTime'] = boundary
+            boundary_ids = {str(record[self.id_key]) for record, time in zip(page, times) if time == boundary}
+        if boundary == self._boundary:
+            self._boundary_ids |= boundary_ids
+        else:
+            self._boundary, self._boundary_ids = boundary, boundary_ids
+        return fresh
+
+
+def paginate(fetch: Callable[[Dict[str, Any]], List[Dict[str, Any]]], cursor: PageCursor) -> Iterator[Dict[str, Any]]:
+    """Yield records lazily, fetching the next page only once the current one is consumed"""
+    while not cursor.done:
+        yield from cursor.advance(fetch(dict(cursor.params)))
+
+
+async def apaginate(
+    fetch: Callable[[Dict[str, Any]], Awaitable[List[Dict[str, Any]]]],
+    cursor: PageCursor
+) -> AsyncIterator[Dict[str, Any]]:
+    """Async generator version of ``paginate``"""
+    while not cursor.done:
+        for record in cursor.advance(await fetch(dict(cursor.params))):
+            yield record
@@ -0,0 +1,156 @@
+"""
+TooBit API client-side rate limiting
+"""
+
+import json
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Union
+
+from .config import TooBitConfig
+
+
+Weight = Union[int, Callable[[Dict[str, Any]], int]]
+
+# Request weight per endpoint path, callables receive the request parameters
+ENDPOINT_WEIGHTS: Dict[str, Weight] = {
+    # Market data
+    '/quote/v1/ping': 1,
+    '/quote/v1/time': 1,
+    '/api/v1/exchangeInfo': 1,
+    '/quote/v1/depth': 1,
+    '/quote/v1/trades': 1,
+    '/quote/v1/klines': 1,
+    '/quote/v1/ticker/24hr': lambda params: 1 if params.get('symbol') else 40,
+    '/quote/v1/ticker/price': lambda params: 1 if params.get('symbol') else 2,
+    '/quote/v1/ticker/bookTicker': lambda params: 1 if params.get('symbol') else 2,
+    # Spot
+    '/api/v1/spot/order': 1,
+    '/api/v1/spot/batchOrders': 2,
+    '/api/v1/spot/cancelOrderByIds': 5,
+    '/api/v1/spot/openOrders': lambda params: 1 if params.get('symbol') else 5,
+    '/api/v1/spot/tradeOrders': 5,
+    '/api/v1/account/trades': 5,
+    '/api/v1/account': 5,
+    '/api/v1/account/subAccount': 5,
+    '/api/v1/account/checkApiKey': 1,
+    '/api/v1/account/balanceFlow': 5,
+    '/api/v1/subAccount/transfer': 1,
+    '/api/v1/subAccount/list': 5,
+    # Futures
+    '/api/v1/futures/order': 1,
+    '/api/v1/futures/batchOrders': 2,
+    '/api/v1/futures/openOrders': lambda params: 1 if params.get('symbol') else 5,
+    '/api/v1/futures/positions': 5,
+    '/api/v1/futures/position/trading-stop': 1,
+    '/api/v1/futures/historyOrders': 5,
+    '/api/v1/futures/balance': 5,
+    '/api/v1/futures/positionMargin': 1,
+    '/api/v1/futures/userTrades': 5,
+    '/api/v1/futures/balanceFlow': 5,
+    '/api/v1/futures/commissionRate': 1,
+    '/api/v1/futures/todayPnL': 1,
+    '/api/v1/futures/marginType': 1,
+    '/api/v1/futures/leverage': 1,
+    '/api/v1/futures/accountLeverage': 1,
+}
+
+DEFAULT_WEIGHT = 1
+
+# Endpoints whose POST requests count against the order limit
+ORDER_ENDPOINTS = frozenset({
+    '/api/v1/spot/order',
+    '/api/v1/spot/batchOrders',
+    '/api/v1/futures/order',
+    '/api/v1/futures/batchOrders',
+})
+
+
+class TokenBucket:
+    """Thread-safe token bucket
+
+    Callers reserve tokens up front and are told how long to wait, which lets
+    threads (``time.sleep``) and asyncio tasks (``asyncio.sleep``) share one
+    bucket without holding the lock while waiting.
+    """
+
+    def __init__(self, capacity: float, refill_per_second: float):
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Take tokens and return the seconds to wait before using them
+
+        A request larger than the bucket is charged in full; the debt it
+        leaves becomes the wait, so the refill rate holds on average.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)"""
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+
+
+class RateLimiter:
+    """Weight and order rate limiter shared by sync and async clients
+
+    Request weight is limited per minute (``request_weight_limit``) and order
+    placement per second (``orders_limit``), mirroring the server limits.
+    """
+
+    def __init__(self, request_weight_limit: int = 1200, orders_limit: int = 10,
+                 weights: Optional[Dict[str, Weight]] = None):
+        self.weights = dict(ENDPOINT_WEIGHTS if weights is None else weights)
+        self.request_bucket = TokenBucket(request_weight_limit, request_weight_limit / 60.0)
+        self.order_bucket = TokenBucket(orders_limit, float(orders_limit))
+
+    @classmethod
+    def from_config(cls, config: TooBitConfig) -> "RateLimiter":
+        """Create rate limiter from client configuration"""
+        return cls(config.request_weight_limit, config.orders_limit)
+
+    def request_weight(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> int:
+        """Request weight of an endpoint call"""
+        weight = self.weights.get(endpoint, DEFAULT_WEIGHT)
+        if callable(weight):
+            return weight(params or {})
+        return weight
+
+    @staticmethod
+    def order_count(method: str, endpoint: str, data: Optional[Any] = None) -> int:
+        """Number of orders placed by a request"""
+        if method.upper() != 'POST' or endpoint not in ORDER_ENDPOINTS:
+            return 0
+        if not data:
+            return 1
+        orders = json.loads(data) if isinstance(data, (str, bytes)) else data
+        return len(orders) if isinstance(orders, list) else 1
+
+    def reserve(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                data: Optional[Any] = None) -> float:
+        """Reserve capacity for a request and return the seconds to wait"""
+        wait = self.request_bucket.reserve(self.request_weight(endpoint, params))
+        orders = self.order_count(method, endpoint, data)
+        if orders:
+            wait = max(wait, self.order_bucket.reserve(orders))
+        return wait
+
+    def acquire(self, method: str, endpoint: str, params: Optional[Dict[str, Any]] = None,
+                data: Optional[Any] = None) -> None:
+        """Block the calling thread until the request may be sent"""
+        wait = self.reserve(method, endpoint, params, data)
+        if wait > 0:
+            time.sleep(wait)
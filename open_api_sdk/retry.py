@@ -0,0 +1,83 @@
+"""
+TooBit API request retry policy
+"""
+
+import json
+import random
+from typing import Dict, Any, Optional
+
+from .config import TooBitConfig
+from .exceptions import TooBitException, NetworkError, RateLimitError
+
+
+# Error codes that describe a transient server or network condition
+RETRYABLE_ERROR_CODES = frozenset({
+    -1001,  # Internal error
+    -1002,  # Service unavailable
+    -1003,  # Timeout
+    -1005,  # Rate limit
+    -1006,  # Exception response
+    -1007,  # Request Timeout
+})
+
+
+class RetryPolicy:
+    """Idempotency-aware retry policy with exponential backoff and jitter
+
+    GET and DELETE requests are retried freely. POST requests are only
+    retried when every order they carry has a ``newClientOrderId``, so a
+    duplicate submission is rejected by the server instead of filled twice.
+    """
+
+    def __init__(self, max_retries: int = 3, retry_delay: float = 1.0, max_delay: float = 30.0):
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, config: TooBitConfig) -> "RetryPolicy":
+        """Create retry policy from client configuration"""
+        return cls(
+            max_retries=config.max_retries,
+            retry_delay=config.retry_delay,
+            max_delay=config.retry_max_delay
+        )
+
+    @staticmethod
+    def is_retryable_error(error: TooBitException) -> bool:
+        """Whether the error describes a transient condition"""
+        if error.code is not None:
+            return error.code in RETRYABLE_ERROR_CODES
+        return isinstance(error, (NetworkError, RateLimitError))
+
+    @staticmethod
+    def is_idempotent(method: str, params: Optional[Dict[str, Any]] = None, data: Optional[Any] = None) -> bool:
+        """Whether repeating the request cannot create a duplicate side effect"""
+        if method.upper() in ('GET', 'DELETE'):
+            return True
+        if data:
+            orders = json.loads(data) if isinstance(data, (str, bytes)) else data
+            if isinstance(orders, dict):
+                orders = [orders]
+            return all(isinstance(order, dict) and order.get('newClientOrderId') for order in orders)
+        return bool(params and params.get('newClientOrderId'))
+
+    def should_retry(
+        self,
+        attempt: int,
+        method: str,
+        error: TooBitException,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Any] = None
+    ) -> bool:
+        """Whether the failed attempt (0-based) should be retried"""
+        return (
+            attempt < self.max_retries
+            and self.is_retryable_error(error)
+            and self.is_idempotent(method, params, data)
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """Delay in seconds before the next attempt, exponential with equal jitter"""
+        delay = min(self.max_delay, self.retry_delay * (2 ** attempt))
+        return delay / 2 + random.uniform(0, delay / 2)
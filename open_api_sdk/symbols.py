@@ -0,0 +1,165 @@
+"""
+TooBit API symbol registry: cached exchangeInfo with pre-parsed trading filters
+"""
+
+import threading
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .log import logger
+from .models import SymbolFilters
+
+
+def _decimals(step: Optional[str]) -> int:
+    """Number of decimal places of a step string such as "0.0010" -> 3"""
+    if not step:
+        return 0
+    exponent = Decimal(step).normalize().as_tuple().exponent
+    return max(0, -exponent)
+
+
+def _number(value: Any) -> Optional[float]:
+    if value in (None, ""):
+        return None
+    return float(value)
+
+
+def parse_symbol_filters(symbol_info: Dict[str, Any], is_contract: bool = False) -> SymbolFilters:
+    """Parse one exchangeInfo ``symbols``/``contracts`` entry into numeric filters"""
+    filters = {item.get("filterType"): item for item in symbol_info.get("filters") or []}
+    price_filter = filters.get("PRICE_FILTER", {})
+    lot_size = filters.get("LOT_SIZE", {})
+    min_notional = filters.get("MIN_NOTIONAL", {})
+    trade_amount = filters.get("TRADE_AMOUNT", {})
+    limit_trading = filters.get("LIMIT_TRADING", {})
+
+    tick_size = price_filter.get("tickSize") or symbol_info.get("quotePrecision") or symbol_info.get("quoteAssetPrecision")
+    step_size = lot_size.get("stepSize") or symbol_info.get("baseAssetPrecision")
+
+    return SymbolFilters(
+        symbol=symbol_info["symbol"],
+        status=symbol_info.get("status"),
+        base_asset=symbol_info.get("baseAsset"),
+        quote_asset=symbol_info.get("quoteAsset"),
+        is_contract=is_contract,
+        tick_size=_number(tick_size),
+        price_precision=_decimals(tick_size),
+        min_price=_number(price_filter.get("minPrice")),
+        max_price=_number(price_filter.get("maxPrice")),
+        step_size=_number(step_size),
+        quantity_precision=_decimals(step_size),
+        min_qty=_number(lot_size.get("minQty")),
+        max_qty=_number(lot_size.get("maxQty")),
+        min_notional=_number(min_notional.get("minNotional")),
+        min_amount=_number(trade_amount.get("minAmount")),
+        max_amount=_number(trade_amount.get("maxAmount")),
+        buy_price_up_rate=_number(limit_trading.get("buyPriceUpRate")),
+        sell_price_down_rate=_number(limit_trading.get("sellPriceDownRate")),
+        contract_multiplier=_number(symbol_info.get("contractMultiplier")),
+    )
+
+
+class SymbolRegistry:
+    """TTL-cached exchangeInfo indexed by symbol
+
+    Spot ``symbols`` and futures ``contracts`` are parsed once per refresh into
+    ``SymbolFilters`` and indexed in a dict for O(1) lookups. Entries older than
+    ``ttl`` are refreshed before use; once ``refresh_ahead`` of the TTL has
+    elapsed, a lookup triggers a single background refresh and keeps serving
+    the current data meanwhile.
+    """
+
+    def __init__(
+        self,
+        fetch: Optional[Callable[[], Dict[str, Any]]] = None,
+        ttl: float = 300.0,
+        refresh_ahead: float = 0.8
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self._symbols: Dict[str, SymbolFilters] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def age(self) -> Optional[float]:
+        """Seconds since the last load, None before the first one"""
+        if self._loaded_at is None:
+            return None
+        return time.monotonic() - self._loaded_at
+
+    def load(self, exchange_info: Dict[str, Any]) -> None:
+        """Replace the index with a ``get_exchange_info()`` response"""
+        symbols: Dict[str, SymbolFilters] = {}
+        for symbol_info in exchange_info.get("symbols") or []:
+            symbols[symbol_info["symbol"]] = parse_symbol_filters(symbol_info)
+        for contract_info in exchange_info.get("contracts") or []:
+            symbols[contract_info["symbol"]] = parse_symbol_filters(contract_info, is_contract=True)
+        # Swap the whole index so readers never see a partially built one
+        self._symbols = symbols
+        self._loaded_at = time.monotonic()
+
+    def refresh(self) -> None:
+        """Fetch exchangeInfo now and rebuild the index"""
+        if self.fetch is None:
+            raise ValueError("SymbolRegistry has no fetch function, use load() instead")
+        self.load(self.fetch())
+
+    def _ensure_fresh(self) -> None:
+        if self.fetch is None:
+            return
+        age = self.age
+        if age is None or age >= self.ttl:
+            with self._lock:
+                # Another thread may have refreshed while we waited for the lock
+                age = self.age
+                if age is None or age >= self.ttl:
+                    self.refresh()
+        elif age >= self.ttl * self.refresh_ahead and not self._refreshing:
+            self._refresh_in_background()
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.warning("Background exchangeInfo refresh failed: %s", e)
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, name="toobit-symbol-refresh", daemon=True).start()
+
+    def get(self, symbol: str) -> SymbolFilters:
+        """Filters of a symbol, raises KeyError for unknown symbols"""
+        self._ensure_fresh()
+        return self._symbols[symbol]
+
+    def __getitem__(self, symbol: str) -> SymbolFilters:
+        return self.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        self._ensure_fresh()
+        return symbol in self._symbols
+
+    def __iter__(self) -> Iterator[str]:
+        self._ensure_fresh()
+        return iter(list(self._symbols))
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def symbols(self, contracts: Optional[bool] = None) -> List[SymbolFilters]:
+        """All symbols, optionally only futures contracts (True) or spot symbols (False)"""
+        self._ensure_fresh()
+        return [
+            filters for filters in self._symbols.values()
+            if contracts is None or filters.is_contract == contracts
+        ]
@@ -0,0 +1,181 @@
+"""
+TooBit API incremental history sync with persisted checkpoints
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+from .pagination import PageCursor
+
+
+class SyncEndpoint(NamedTuple):
+    """How to page a history endpoint and where its checkpoint fields live"""
+    path: str
+    id_key: str
+    time_key: str
+    cursor_param: Optional[str]
+    page_size: int
+
+
+SYNC_ENDPOINTS = {
+    'futures_trades': SyncEndpoint('/api/v1/futures/userTrades', 'id', 'time', 'fromId', 1000),
+    'futures_account_flow': SyncEndpoint('/api/v1/futures/balanceFlow', 'id', 'created', 'fromId', 1000),
+    'trades': SyncEndpoint('/api/v1/account/trades', 'id', 'time', 'fromId', 500),
+    'transfers': SyncEndpoint('/api/v1/account/balanceFlow', 'id', 'created', None, 100),
+}
+
+
+class JsonCheckpointStore:
+    """Checkpoints kept in one JSON file
+
+    Every save rewrites the file through a temporary file and ``os.replace``,
+    so a crash mid-write leaves the previous checkpoints intact.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._checkpoints: Dict[str, Dict[str, int]] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self._checkpoints = json.load(f)
+
+    def get(self, key: str) -> Optional[Dict[str, int]]:
+        return self._checkpoints.get(key)
+
+    def set(self, key: str, checkpoint: Dict[str, int]) -> None:
+        with self._lock:
+            self._checkpoints[key] = checkpoint
+            directory = os.path.dirname(os.path.abspath(self.path))
+            fd, tmp_path = tempfile.mkstemp(prefix=".checkpoints-", dir=directory)
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(self._checkpoints, f, indent=2, sort_keys=True)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+
+class HistorySync:
+    """Fetch only the history records added since the previous run
+
+    A checkpoint (last ``id`` and time) is stored per account, endpoint and
+    symbol. The next run resumes from it: by ``fromId`` where the endpoint
+    supports an ID cursor, otherwise by ``startTime``. Records newer than the
+    checkpoint are streamed a page at a time, so memory stays bounded by one
+    page: oldest first when paging by ID or forward in time, page by page
+    (each page oldest first) when the endpoint walks time windows newest
+    first. The checkpoint advances as records are consumed and is saved
+    after every ``save_every`` records and when the iteration stops, so a
+    crashed run re-delivers at most the unsaved tail (at-least-once); a
+    newest-first walk saves it only once complete, as older records are
+    still to come until then.
+    """
+
+    def __init__(self, client, store: JsonCheckpointStore, account: str = "default", save_every: int = 1000):
+        self.client = client
+        self.store = store
+        self.account = account
+        self.save_every = save_every
+
+    def checkpoint_key(self, endpoint: str, symbol: Optional[str] = None) -> str:
+        return f"{self.account}|{endpoint}|{symbol or '*'}"
+
+    def reset(self, endpoint: str, symbol: Optional[str] = None) -> None:
+        """Forget a checkpoint so the next run starts over"""
+        self.store.set(self.checkpoint_key(endpoint, symbol), {})
+
+    def sync(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        symbol: Optional[str] = None,
+        since: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the new records of a ``SYNC_ENDPOINTS`` entry
+
+        ``since`` (milliseconds) bounds the first run, when no checkpoint exists yet.
+        """
+        spec = SYNC_ENDPOINTS[endpoint]
+        key = self.checkpoint_key(endpoint, symbol)
+        checkpoint = self.store.get(key) or {}
+        params = dict(params)
+        if checkpoint and spec.cursor_param:
+            params[spec.cursor_param] = checkpoint['id']
+        elif checkpoint:
+            params['startTime'] = checkpoint['time']
+        elif since:
+            params['startTime'] = since
+
+        def sort_key(record: Dict[str, Any]):
+            return int(record[spec.time_key]), int(record[spec.id_key])
+
+        def is_new(record: Dict[str, Any]) -> bool:
+            if not checkpoint:
+                return True
+            if spec.cursor_param:
+                return int(record[spec.id_key]) > checkpoint['id']
+            return sort_key(record) > (checkpoint['time'], checkpoint['id'])
+
+        def save(record: Dict[str, Any]) -> None:
+            self.store.set(key, {'id': int(record[spec.id_key]), 'time': int(record[spec.time_key])})
+
+        fetch = lambda page_params: self.client._make_request('GET', spec.path, page_params, signed=True)
+        cursor = PageCursor(params, spec.id_key, spec.time_key, spec.page_size, spec.cursor_param)
+
+        last = None
+        unsaved = 0
+        completed = False
+        try:
+            while not cursor.done:
+                page = [record for record in cursor.advance(fetch(dict(cursor.params))) if is_new(record)]
+                if cursor.cursor_param is None:
+                    # Time windows come in either order, ID pages are already ascending
+                    page.sort(key=sort_key)
+                for record in page:
+                    yield record
+                    # The caller asked for the next record, so this one has been handled
+                    if last is None or sort_key(record) > sort_key(last):
+                        last = record
+                    unsaved += 1
+                    if unsaved >= self.save_every and not cursor.descending:
+                        save(last)
+                        unsaved = 0
+            completed = True
+        finally:
+            if last is not None and unsaved and (completed or not cursor.descending):
+                save(last)
+
+    def futures_trades(self, symbol: str, since: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """New futures trades of a symbol"""
+        return self.sync('futures_trades', {'symbol': symbol}, symbol, since)
+
+    def futures_account_flow(self, symbol: Optional[str] = None, flow_type: Optional[int] = None,
+                             since: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """New futures account flow records, optionally of one asset and flow type"""
+        params = {}
+        if symbol:
+            params['symbol'] = symbol
+        if flow_type:
+            params['flowType'] = flow_type
+        return self.sync('futures_account_flow', params, f"{symbol or '*'}:{flow_type}" if flow_type else symbol, since)
+
+    def trades(self, symbol: str, since: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """New spot trades of a symbol"""
+        return self.sync('trades', {'symbol': symbol}, symbol, since)
+
+    def transfers(self, asset: Optional[str] = None, flow_type: Optional[int] = None,
+                  since: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """New spot balance flow (transfer history) records, optionally of one asset and flow type"""
+        params = {}
+        if asset:
+            params['asset'] = asset
+        if flow_type:
+            params['flowType'] = flow_type
+        return self.sync('transfers', params, f"{asset or '*'}:{flow_type}" if flow_type else asset, since)
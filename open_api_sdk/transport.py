@@ -0,0 +1,92 @@
+"""
+TooBit API HTTP transport configuration
+"""
+
+import socket
+from typing import List, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+from .config import TooBitConfig
+
+
+def keepalive_socket_options(idle: int = 30, interval: int = 10, count: int = 3) -> List[Tuple[int, int, int]]:
+    """Socket options enabling TCP keepalive probes where the platform supports them"""
+    options = list(HTTPConnection.default_socket_options)
+    options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+    # Linux names the idle option TCP_KEEPIDLE, macOS TCP_KEEPALIVE
+    idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(socket, "TCP_KEEPALIVE", None)
+    if idle_option is not None:
+        options.append((socket.IPPROTO_TCP, idle_option, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with a sized connection pool and optional TCP keepalive"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, pool_block: bool = False,
+                 tcp_keepalive: bool = True):
+        self.socket_options = keepalive_socket_options() if tcp_keepalive else None
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self.socket_options is not None:
+            pool_kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+
+MARKET_LANE = "market"
+TRADE_LANE = "trade"
+
+# Order placement and cancellation paths, their POST/DELETE requests use the trade lane
+TRADE_ENDPOINTS = frozenset({
+    '/api/v1/spot/order',
+    '/api/v1/spot/batchOrders',
+    '/api/v1/spot/cancelOrderByIds',
+    '/api/v1/spot/openOrders',
+    '/api/v1/futures/order',
+    '/api/v1/futures/batchOrders',
+    '/api/v1/futures/position/trading-stop',
+})
+
+
+def request_lane(method: str, endpoint: str) -> str:
+    """Connection lane of a request: urgent order traffic never queues behind market data"""
+    if method.upper() != 'GET' and endpoint in TRADE_ENDPOINTS:
+        return TRADE_LANE
+    return MARKET_LANE
+
+
+def lane_timeout(config: TooBitConfig, lane: str) -> float:
+    """Request timeout of a lane"""
+    if lane == TRADE_LANE and config.trade_timeout is not None:
+        return config.trade_timeout
+    return config.timeout
+
+
+def lane_pool_maxsize(config: TooBitConfig, lane: str) -> int:
+    """Connection pool size of a lane"""
+    return config.trade_pool_maxsize if lane == TRADE_LANE else config.pool_maxsize
+
+
+def create_session(config: TooBitConfig, lane: str = MARKET_LANE) -> requests.Session:
+    """Create a requests session whose pool is sized from the client configuration"""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": "TooBit-SDK/1.0.0"
+    })
+    adapter = PooledHTTPAdapter(
+        pool_connections=config.pool_connections,
+        pool_maxsize=lane_pool_maxsize(config, lane),
+        pool_block=config.pool_block,
+        tcp_keepalive=config.tcp_keepalive
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -0,0 +1,124 @@
+"""
+TooBit API local pre-trade order validation
+"""
+
+import math
+from typing import Dict, List, Union
+
+from .exceptions import ValidationError
+from .models import OrderRequest, FuturesOrderRequest, SymbolFilters
+from .symbols import SymbolRegistry
+
+
+AnyOrderRequest = Union[OrderRequest, FuturesOrderRequest]
+
+ROUND = "round"
+REJECT = "reject"
+
+# Tolerance when checking whether a value already lies on the tick/step grid
+_GRID_EPSILON = 1e-9
+
+
+def _on_grid(value: float, step: float) -> bool:
+    units = value / step
+    return abs(units - round(units)) < _GRID_EPSILON * max(1.0, abs(units))
+
+
+def _floor_to(value: float, step: float, precision: int) -> float:
+    return round(math.floor(value / step + _GRID_EPSILON) * step, precision)
+
+
+def _ceil_to(value: float, step: float, precision: int) -> float:
+    return round(math.ceil(value / step - _GRID_EPSILON) * step, precision)
+
+
+class OrderValidator:
+    """Check orders against exchangeInfo filters before they are sent
+
+    In ``round`` mode prices are moved onto the tick grid in the passive
+    direction (buy down, sell up) and quantities are rounded down to the
+    step, and on-grid values are rounded to the filter's precision to shed
+    float noise; in ``reject`` mode off-grid values are rejected. Both modes then
+    reject orders outside the price, quantity and notional limits with a
+    ``ValidationError``, saving the round trip and order-limit budget.
+    """
+
+    def __init__(self, registry: SymbolRegistry, mode: str = ROUND):
+        if mode not in (ROUND, REJECT):
+            raise ValueError(f"Unsupported order validation mode: {mode}, expected {ROUND} or {REJECT}")
+        self.registry = registry
+        self.mode = mode
+
+    def _filters(self, symbol: str) -> SymbolFilters:
+        try:
+            return self.registry.get(symbol)
+        except KeyError:
+            raise ValidationError(f"Unknown symbol: {symbol}")
+
+    def _check(self, order: AnyOrderRequest, filters: SymbolFilters) -> AnyOrderRequest:
+        """Return the order (rounded copy in round mode) or raise ValidationError"""
+        price, quantity = order.price, order.quantity
+        is_buy = str(order.side).upper().startswith("BUY")
+        updates = {}
+
+        if price is not None and filters.tick_size:
+            if not _on_grid(price, filters.tick_size):
+                if self.mode == REJECT:
+                    raise ValidationError(f"{order.symbol} price {price} is not a multiple of tick size {filters.tick_size}")
+                round_price = _floor_to if is_buy else _ceil_to
+                price = updates["price"] = round_price(price, filters.tick_size, filters.price_precision)
+            elif self.mode == ROUND and round(price, filters.price_precision) != price:
+                # On the grid up to float noise (0.1 + 0.2): send the clean decimal
+                price = updates["price"] = round(price, filters.price_precision)
+            if filters.min_price and price < filters.min_price:
+                raise ValidationError(f"{order.symbol} price {price} is below minimum price {filters.min_price}")
+            if filters.max_price and price > filters.max_price:
+                raise ValidationError(f"{order.symbol} price {price} is above maximum price {filters.max_price}")
+
+        if quantity is not None and filters.step_size:
+            if not _on_grid(quantity, filters.step_size):
+                if self.mode == REJECT:
+                    raise ValidationError(f"{order.symbol} quantity {quantity} is not a multiple of step size {filters.step_size}")
+                quantity = updates["quantity"] = _floor_to(quantity, filters.step_size, filters.quantity_precision)
+            elif self.mode == ROUND and round(quantity, filters.quantity_precision) != quantity:
+                quantity = updates["quantity"] = round(quantity, filters.quantity_precision)
+            if filters.min_qty and quantity < filters.min_qty:
+                raise ValidationError(f"{order.symbol} quantity {quantity} is below minimum quantity {filters.min_qty}")
+            if filters.max_qty and quantity > filters.max_qty:
+                raise ValidationError(f"{order.symbol} quantity {quantity} is above maximum quantity {filters.max_qty}")
+
+        if price is not None and quantity is not None:
+            notional = price * quantity * (filters.contract_multiplier or 1.0)
+            if filters.min_notional and notional < filters.min_notional:
+                raise ValidationError(f"{order.symbol} notional {notional} is below minimum notional {filters.min_notional}")
+            if filters.min_amount and notional < filters.min_amount:
+                raise ValidationError(f"{order.symbol} amount {notional} is below minimum amount {filters.min_amount}")
+            if filters.max_amount and notional > filters.max_amount:
+                raise ValidationError(f"{order.symbol} amount {notional} is above maximum amount {filters.max_amount}")
+
+        return order.model_copy(update=updates) if updates else order
+
+    def validate(self, order: AnyOrderRequest) -> AnyOrderRequest:
+        """Validate one order, returning it (or its rounded copy)"""
+        return self._check(order, self._filters(order.symbol))
+
+    def validate_batch(self, orders: List[AnyOrderRequest]) -> List[AnyOrderRequest]:
+        """Validate a whole order list in one pass, looking each symbol up once
+
+        Raises one ValidationError listing every rejected order by index
+        (``error.response["errors"]``) so no part of the batch is sent.
+        """
+        filters_by_symbol: Dict[str, SymbolFilters] = {}
+        validated: List[AnyOrderRequest] = []
+        errors: Dict[int, str] = {}
+        for index, order in enumerate(orders):
+            try:
+                if order.symbol not in filters_by_symbol:
+                    filters_by_symbol[order.symbol] = self._filters(order.symbol)
+                validated.append(self._check(order, filters_by_symbol[order.symbol]))
+            except ValidationError as e:
+                errors[index] = e.message
+        if errors:
+            summary = "; ".join(f"#{index}: {message}" for index, message in errors.items())
+            raise ValidationError(f"{len(errors)} of {len(orders)} orders rejected: {summary}", response={"errors": errors})
+        return validated
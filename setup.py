@@ -26,7 +26,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/toobit-api-sdk",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "examples"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -44,6 +44,15 @@ setup(
     python_requires=">=3.7",
     install_requires=requirements,
     extras_require={
+        "async": [
+            "aiohttp>=3.8.0",
+        ],
+        "fast": [
+            "orjson>=3.8.0",
+        ],
+        "numpy": [
+            "numpy>=1.21.0",
+        ],
         "dev": [
             "pytest>=6.0",
             "pytest-cov>=2.0",